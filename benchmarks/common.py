@@ -0,0 +1,44 @@
+"""Общие помощники для бенчмарков обоих проектов."""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+PROJECTS = {
+    'ya_news': 'yanews.settings',
+    'ya_note': 'yanote.settings',
+}
+
+
+def setup_django(project, database=None):
+    """
+    Настраиваем Django для одного из проектов репозитория.
+
+    database — путь к отдельному файлу SQLite, чтобы бенчмарки
+    не трогали рабочую базу проекта.
+    """
+    sys.path.insert(0, str(BASE_DIR / project))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', PROJECTS[project])
+    # Бенчмарк шаблонов собирает движок из продакшен-профиля.
+    os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark-secret-key')
+    import django
+    from django.conf import settings
+    if database is not None:
+        settings.DATABASES['default']['NAME'] = str(database)
+    django.setup()
+
+
+def measure(func, repeat=5):
+    """Медиана и минимум времени выполнения func в миллисекундах."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+    }
@@ -0,0 +1,95 @@
+"""
+Бенчмарк составных индексов на большой базе SQLite.
+
+Сравнивает планы (EXPLAIN QUERY PLAN) и время горячих запросов
+до и после миграций с индексами. Запуск из корня репозитория:
+
+    python -m benchmarks.indexes ya_news --rows 1000000
+    python -m benchmarks.indexes ya_note --rows 1000000
+"""
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import measure, setup_django
+from benchmarks.seed import seed_news, seed_notes
+
+
+def news_queries():
+    from news.models import Comment, News
+    return {
+        'home': lambda: News.objects.order_by('-date', '-id')[:10],
+        'comments_of_news': lambda: Comment.objects.filter(
+            news_id=1
+        ).order_by('created', 'id')[:50],
+        'comment_of_author': lambda: Comment.objects.filter(
+            author_id=1, pk=1
+        ),
+    }
+
+
+def notes_queries():
+    from notes.models import Note
+    return {
+        'notes_of_author': lambda: Note.objects.filter(
+            author_id=1
+        ).order_by('id')[:50],
+    }
+
+
+SCENARIOS = {
+    'ya_news': ('news', '0002_news_comment_count', seed_news, news_queries),
+    'ya_note': ('notes', '0001_initial', seed_notes, notes_queries),
+}
+
+
+def run_queries(queries, repeat):
+    return {
+        name: {
+            'plan': make_queryset().explain(),
+            **measure(lambda: list(make_queryset()), repeat),
+        }
+        for name, make_queryset in queries.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('project', choices=SCENARIOS)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(args.project, Path(tmp) / 'bench.sqlite3')
+        from django.core.management import call_command
+        from django.db import connection, transaction
+
+        app, before, seed, queries = SCENARIOS[args.project]
+        call_command('migrate', verbosity=0)
+        call_command('migrate', app, before, verbosity=0)
+        with transaction.atomic(), connection.cursor() as cursor:
+            seed(cursor, args.rows)
+        report = {}
+        for stage in ('before', 'after'):
+            if stage == 'after':
+                call_command('migrate', app, verbosity=0)
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+            report[stage] = run_queries(queries(), args.repeat)
+
+    for name in report['before']:
+        print(f'== {name}')
+        for stage in ('before', 'after'):
+            result = report[stage][name]
+            print(f'  {stage}: {result["median_ms"]} ms')
+            for line in result['plan'].splitlines():
+                print(f'    {line}')
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Локальный генератор нагрузки по образцу locust.
+
+Проект поднимается в отдельном процессе, а конкурентные «пользователи»
+на asyncio выбирают запросы из взвешенного списка задач.
+"""
+import asyncio
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from importlib import import_module
+from urllib.parse import urlencode
+
+from benchmarks.common import BASE_DIR, PROJECTS, setup_django
+
+# Любой токен нужной длины: CsrfViewMiddleware сверяет cookie с полем формы.
+CSRF_TOKEN = 'x' * 64
+
+
+class Task:
+    """Один HTTP-запрос сценария нагрузки."""
+
+    def __init__(self, name, path, weight=1, data=None, session=None):
+        self.name = name
+        self.path = path
+        self.weight = weight
+        self.data = data
+        self.session = session
+
+    def render(self, index):
+        """Готовим запрос; {index} в пути и данных даёт уникальные значения."""
+        path = self.path.format(index=index)
+        cookies = [f'csrftoken={CSRF_TOKEN}']
+        if self.session:
+            cookies.append(f'sessionid={self.session}')
+        lines = [
+            f'{"POST" if self.data else "GET"} {path} HTTP/1.1',
+            'Host: localhost',
+            'Connection: close',
+            f'Cookie: {"; ".join(cookies)}',
+        ]
+        body = b''
+        if self.data:
+            body = urlencode({
+                'csrfmiddlewaretoken': CSRF_TOKEN,
+                **{key: str(value).format(index=index)
+                   for key, value in self.data.items()},
+            }).encode()
+            lines += [
+                'Content-Type: application/x-www-form-urlencoded',
+                f'Content-Length: {len(body)}',
+            ]
+        head = '\r\n'.join(lines) + '\r\n\r\n'
+        return head.encode(), body
+
+
+def serve(project, mode, port, database):
+    """Запускаем проект как WSGI- или ASGI-сервер в текущем процессе."""
+    setup_django(project, database)
+    from django.conf import settings
+    settings.DEBUG = False
+    if mode == 'asgi':
+        # Точка входа проекта: yanews.asgi сам ведёт запросы
+        # в асинхронные страницы.
+        import uvicorn
+        package = PROJECTS[project].partition('.')[0]
+        application = import_module(f'{package}.asgi').application
+        uvicorn.run(
+            application, host='127.0.0.1', port=port,
+            log_level='warning', access_log=False
+        )
+    else:
+        from django.core.servers.basehttp import WSGIRequestHandler, run
+        from django.core.wsgi import get_wsgi_application
+        WSGIRequestHandler.log_message = lambda *args: None
+        run('127.0.0.1', port, get_wsgi_application(), threading=True)
+
+
+def start_server(project, mode, database):
+    """Поднимаем сервер в дочернем процессе и ждём, пока он примет порт."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.load', project, mode, str(port),
+         str(database)],
+        cwd=BASE_DIR
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server, port
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f'Сервер {project} ({mode}) не запустился.')
+
+
+async def fetch(port, request, slow_ms):
+    head, body = request
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    start = time.perf_counter()
+    writer.write(head)
+    if slow_ms:
+        await writer.drain()
+        await asyncio.sleep(slow_ms / 1000)
+    writer.write(body)
+    await writer.drain()
+    response = await reader.read()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    # Успехом считаем 2xx и 3xx: POST форм отвечает редиректом.
+    return elapsed, response[9:10] in (b'2', b'3')
+
+
+def summarize(timings, errors, duration):
+    timings = sorted(timings)
+    if not timings:
+        return {'requests': 0, 'errors': errors}
+    return {
+        'requests': len(timings),
+        'requests_per_second': round(len(timings) / duration, 1),
+        'p50_ms': round(statistics.median(timings), 2),
+        'p99_ms': round(timings[max(int(len(timings) * 0.99) - 1, 0)], 2),
+        'errors': errors,
+    }
+
+
+async def run_load(port, tasks, requests, concurrency, slow_ms=0):
+    """
+    Выполняем requests запросов в concurrency соединений.
+
+    Задачи выбираются случайно с учётом весов; результат —
+    общая сводка и сводка по каждой задаче.
+    """
+    rng = random.Random(0)
+    plan = iter(enumerate(rng.choices(
+        tasks, weights=[task.weight for task in tasks], k=requests
+    )))
+    results = {task.name: ([], [0]) for task in tasks}
+
+    async def user():
+        for index, task in plan:
+            timings, errors = results[task.name]
+            try:
+                elapsed, ok = await fetch(port, task.render(index), slow_ms)
+            except OSError:
+                errors[0] += 1
+                continue
+            timings.append(elapsed * 1000)
+            errors[0] += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+    report = {
+        name: summarize(timings, errors[0], duration)
+        for name, (timings, errors) in results.items()
+    }
+    report['total'] = summarize(
+        [value for timings, _ in results.values() for value in timings],
+        sum(errors[0] for _, errors in results.values()),
+        duration
+    )
+    return report
+
+
+def load(port, tasks, requests, concurrency, slow_ms=0):
+    return asyncio.run(run_load(port, tasks, requests, concurrency, slow_ms))
+
+
+if __name__ == '__main__':
+    project, mode, port, database = sys.argv[1:]
+    serve(project, mode, int(port), database)
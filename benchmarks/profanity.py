@@ -0,0 +1,65 @@
+"""
+Бенчмарк проверки комментария на запрещённые слова.
+
+Сравнивает прежний цикл `word in text` по каждому слову словаря
+с автоматом Ахо — Корасик. Запуск из корня репозитория:
+
+    python -m benchmarks.profanity --words 5000 --length 2000
+"""
+import argparse
+import json
+import random
+
+from benchmarks.common import measure, setup_django
+
+ALPHABET = 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'
+
+
+def random_word(min_length=4, max_length=10):
+    return ''.join(
+        random.choice(ALPHABET)
+        for _ in range(random.randint(min_length, max_length))
+    )
+
+
+def naive_search(words, text):
+    lowered_text = text.lower()
+    for word in words:
+        if word in lowered_text:
+            return word
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--words', type=int, default=5000)
+    parser.add_argument('--length', type=int, default=2000)
+    parser.add_argument('--texts', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django('ya_news')
+    from news.profanity import BadWordsMatcher
+
+    random.seed(0)
+    words = [random_word() for _ in range(args.words)]
+    texts = [
+        ' '.join(random_word(2, 8) for _ in range(args.length // 6))
+        for _ in range(args.texts)
+    ]
+    matcher = BadWordsMatcher(words)
+    report = {
+        'build': measure(lambda: BadWordsMatcher(words), args.repeat),
+        'naive': measure(
+            lambda: [naive_search(words, text) for text in texts],
+            args.repeat
+        ),
+        'aho_corasick': measure(
+            lambda: [matcher.search(text) for text in texts], args.repeat
+        ),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
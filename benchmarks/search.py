@@ -0,0 +1,71 @@
+"""
+Бенчмарк полнотекстового поиска по заметкам на большой базе SQLite.
+
+Заполняет временную базу заметками из случайных слов (индекс FTS5
+наполняют триггеры) и замеряет страницы выдачи для редкого и частого
+слова. Запуск из корня репозитория:
+
+    python -m benchmarks.search --rows 1000000
+"""
+import argparse
+import itertools
+import json
+import random
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import measure, setup_django
+
+USERS = 100
+VOCABULARY = [f'слово{index}' for index in range(50000)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django('ya_note', Path(tmp) / 'bench.sqlite3')
+        from django.contrib.auth import get_user_model
+        from django.core.management import call_command
+        from django.db import connection, transaction
+
+        from notes.search import search_notes
+
+        call_command('migrate', verbosity=0)
+        User = get_user_model()
+        User.objects.bulk_create(
+            User(username=f'user{index}') for index in range(USERS)
+        )
+        users = list(User.objects.all())
+        random.seed(0)
+        # Частота слов убывает с номером, как в живом тексте.
+        weights = list(itertools.accumulate(
+            1 / (rank + 1) for rank in range(len(VOCABULARY))
+        ))
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO notes_note (title, text, slug, author_id) '
+                'VALUES (%s, %s, %s, %s)',
+                ((' '.join(random.choices(
+                    VOCABULARY, cum_weights=weights, k=3)),
+                  ' '.join(random.choices(
+                      VOCABULARY, cum_weights=weights, k=30)),
+                  f'note-{index}',
+                  random.choice(users).pk)
+                 for index in range(args.rows))
+            )
+        author = users[0]
+        report = {
+            query: measure(
+                lambda: search_notes(author, query, 21), args.repeat
+            )
+            for query in (VOCABULARY[0], VOCABULARY[100], VOCABULARY[-1])
+        }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
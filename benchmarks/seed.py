@@ -0,0 +1,77 @@
+"""
+Наполнение базы для бенчмарков пакетными INSERT.
+
+Строки вставляются executemany в обход моделей, поэтому миллион
+комментариев или заметок заливается за секунды.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+
+USERS = 1000
+
+
+def seed_users(cursor, count=USERS):
+    from django.contrib.auth import get_user_model
+    User = get_user_model()
+    User.objects.bulk_create(
+        User(username=f'user{index}') for index in range(count)
+    )
+    cursor.execute('SELECT min(id), max(id) FROM auth_user')
+    return cursor.fetchone()
+
+
+def seed_news(cursor, rows):
+    """Новости и rows комментариев, новостей в десять раз меньше."""
+    first_user, last_user = seed_users(cursor)
+    news_rows = max(rows // 10, 1)
+    today = date.today()
+    cursor.executemany(
+        'INSERT INTO news_news (title, text, date, comment_count) '
+        'VALUES (%s, %s, %s, 0)',
+        ((f'Новость {index}', 'Текст', today - timedelta(days=index % 3650))
+         for index in range(news_rows))
+    )
+    started = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    # Каждый десятый комментарий — к «горячей» новости с id=1.
+    cursor.executemany(
+        'INSERT INTO news_comment (text, created, author_id, news_id) '
+        'VALUES (%s, %s, %s, %s)',
+        (('Комментарий',
+          started + timedelta(seconds=index),
+          random.randint(first_user, last_user),
+          1 if index % 10 == 0 else random.randint(1, news_rows))
+         for index in range(rows))
+    )
+
+
+def seed_notes(cursor, rows):
+    first_user, last_user = seed_users(cursor)
+    cursor.executemany(
+        'INSERT INTO notes_note (title, text, slug, author_id) '
+        'VALUES (%s, %s, %s, %s)',
+        ((f'Заметка {index}', 'Текст', f'note-{index}',
+          random.randint(first_user, last_user))
+         for index in range(rows))
+    )
+
+
+SEEDERS = {
+    'ya_news': seed_news,
+    'ya_note': seed_notes,
+}
+
+
+def seed_project(project, rows):
+    """Применяем миграции и наполняем базу уже настроенного проекта."""
+    from django.core.management import call_command
+    from django.db import connection, transaction
+
+    random.seed(0)
+    call_command('migrate', verbosity=0)
+    with transaction.atomic(), connection.cursor() as cursor:
+        SEEDERS[project](cursor, rows)
+    if project == 'ya_news':
+        from news.models import News
+        News.objects.refresh_comment_count()
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
@@ -0,0 +1,59 @@
+"""
+Нагрузочное сравнение развёртываний ya_news через WSGI и ASGI.
+
+Заполняет временную базу, по очереди поднимает проект как
+многопоточный WSGI-сервер Django (как runserver) и как ASGI-приложение
+под uvicorn, и нагружает главную и страницу новости конкурентными
+клиентами. --slow-ms задаёт паузу посреди отправки запроса, как
+у медленного мобильного клиента. Запуск из корня репозитория:
+
+    python -m benchmarks.serving --requests 2000 --concurrency 50
+"""
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import setup_django
+from benchmarks.load import Task, load, start_server
+from benchmarks.seed import seed_project
+
+MODES = ('wsgi', 'asgi')
+TASKS = [
+    Task('home', '/'),
+    Task('detail_hot', '/news/1/'),
+    Task('detail', '/news/2/'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--slow-ms', type=int, default=0)
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / 'bench.sqlite3'
+        setup_django('ya_news', database)
+        from django.db import connection
+
+        seed_project('ya_news', args.rows)
+        connection.close()
+        for mode in MODES:
+            server, port = start_server('ya_news', mode, database)
+            try:
+                report[mode] = load(
+                    port, TASKS, args.requests, args.concurrency,
+                    args.slow_ms
+                )['total']
+            finally:
+                server.terminate()
+                server.wait()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Микробенчмарк получения slug из заголовка заметки.
+
+Сравнивает pytils.translit.slugify, табличную транслитерацию
+без кеша и с LRU-кешем. Запуск из корня репозитория:
+
+    python -m benchmarks.slugify --titles 10000 --unique 1000
+"""
+import argparse
+import json
+import random
+
+from benchmarks.common import measure, setup_django
+
+WORDS = (
+    'Заметка', 'список', 'покупок', 'на', 'неделю', 'Щука', 'ёлка',
+    'встреча', 'с', 'командой', 'план', 'отпуска', 'Django', '2024',
+    'идеи', '«важное»', 'черновик', '—', 'хозяйство', 'Юбилей',
+)
+
+
+def random_title():
+    return ' '.join(random.choices(WORDS, k=random.randint(2, 8)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--titles', type=int, default=10000)
+    parser.add_argument('--unique', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django('ya_note')
+    from pytils.translit import slugify as pytils_slugify
+
+    from notes.slugs import slugify
+
+    random.seed(0)
+    unique_titles = [random_title() for _ in range(args.unique)]
+    titles = random.choices(unique_titles, k=args.titles)
+
+    def cached():
+        slugify.cache_clear()
+        for title in titles:
+            slugify(title)
+
+    results = {
+        'pytils': measure(
+            lambda: [pytils_slugify(title) for title in titles], args.repeat
+        ),
+        'table': measure(
+            lambda: [slugify.__wrapped__(title) for title in titles],
+            args.repeat
+        ),
+        'table_cached': measure(cached, args.repeat),
+    }
+    for result in results.values():
+        result['per_title_us'] = round(
+            result['median_ms'] * 1000 / args.titles, 3
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""
+Набор бенчмарков обоих проектов с JSON-отчётом и сравнением с эталоном.
+
+Для каждого проекта заполняется временная база, после чего:
+- сценарии прогоняются в процессе через тестовый клиент Django,
+  для каждого — время и число SQL-запросов;
+- проект поднимается как WSGI-сервер и нагружается смесью запросов
+  генератором из benchmarks.load.
+С --baseline отчёт сравнивается с сохранённым ранее, и при регрессии
+команда завершается с кодом 1. Запуск из корня репозитория:
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --baseline baseline.json
+"""
+import argparse
+import itertools
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import BASE_DIR, setup_django
+from benchmarks.load import Task, load, start_server
+from benchmarks.seed import seed_project
+
+PROJECTS = ('ya_news', 'ya_note')
+QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def news_scenarios(anonymous, author):
+    from django.core.cache import cache
+
+    def detail_cold(index):
+        cache.clear()
+        return [anonymous.get('/news/1/')]
+
+    return {
+        'home_anonymous': lambda index: [anonymous.get('/')],
+        'home_authenticated': lambda index: [author.get('/')],
+        'detail_hot_thread': lambda index: [anonymous.get('/news/1/')],
+        'detail_hot_thread_cold': detail_cold,
+        'comment_post': lambda index: [author.post(
+            '/news/2/', {'text': f'Комментарий {index}'}
+        )],
+        'api_news': lambda index: [anonymous.get('/api/news/')],
+    }
+
+
+def notes_scenarios(anonymous, author):
+    from notes.models import Note
+    slug = Note.objects.filter(author__username='user0').values_list(
+        'slug', flat=True
+    ).first()
+
+    def crud(index):
+        slug = f'bench-{index}'
+        data = {'title': f'Бенчмарк {index}', 'text': 'Текст', 'slug': slug}
+        return [
+            author.post('/add/', data),
+            author.post(f'/edit/{slug}/', {**data, 'text': 'Новый текст'}),
+            author.post(f'/delete/{slug}/'),
+        ]
+
+    return {
+        'list': lambda index: [author.get('/notes/')],
+        'detail': lambda index: [author.get(f'/note/{slug}/')],
+        'note_crud': crud,
+        'search': lambda index: [author.get('/search/', {'q': 'Заметка'})],
+    }
+
+
+def news_tasks(session):
+    return [
+        Task('home', '/', weight=5),
+        Task('detail_hot_thread', '/news/1/', weight=2),
+        Task('detail', '/news/2/', weight=3),
+        Task('comment_post', '/news/2/', data={'text': 'Комментарий {index}'},
+             session=session),
+    ]
+
+
+def notes_tasks(session):
+    from notes.models import Note
+    slug = Note.objects.filter(author__username='user0').values_list(
+        'slug', flat=True
+    ).first()
+    return [
+        Task('list', '/notes/', weight=4, session=session),
+        Task('detail', f'/note/{slug}/', weight=4, session=session),
+        Task('add', '/add/', data={'title': 'Нагрузка {index}',
+                                   'text': 'Текст'}, session=session),
+    ]
+
+
+SCENARIOS = {
+    'ya_news': (news_scenarios, news_tasks),
+    'ya_note': (notes_scenarios, notes_tasks),
+}
+
+
+def run_scenario(func, repeat, counter):
+    """Время одного прогона сценария и число SQL-запросов в нём."""
+    func(next(counter))
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        responses = func(next(counter))
+        timings.append((time.perf_counter() - start) * 1000)
+        queries = sum(
+            int(QUERIES.search(response['Server-Timing']).group(1))
+            for response in responses
+        )
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'stddev_ms': round(statistics.pstdev(timings), 3),
+        'ops': round(1000 / statistics.mean(timings), 1),
+        'queries': queries,
+    }
+
+
+def run_project(project, args):
+    """Прогоняем один проект; вызывается в отдельном процессе."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / 'bench.sqlite3'
+        setup_django(project, database)
+        from django.conf import settings
+        from django.contrib.auth import get_user_model
+        from django.db import connection
+        from django.test import Client
+
+        settings.DEBUG = False
+        seed_project(project, args.rows)
+        user = get_user_model().objects.get(username='user0')
+        anonymous = Client(HTTP_HOST='localhost')
+        author = Client(HTTP_HOST='localhost')
+        author.force_login(user)
+        make_scenarios, make_tasks = SCENARIOS[project]
+        counter = itertools.count()
+        report = {'scenarios': {
+            name: run_scenario(func, args.repeat, counter)
+            for name, func in make_scenarios(anonymous, author).items()
+        }}
+        tasks = make_tasks(author.cookies['sessionid'].value)
+        connection.close()
+        server, port = start_server(project, 'wsgi', database)
+        try:
+            report['load'] = load(
+                port, tasks, args.requests, args.concurrency
+            )
+        finally:
+            server.terminate()
+            server.wait()
+    return report
+
+
+def metadata(args):
+    import sqlite3
+
+    import django
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'rows': args.rows,
+        'repeat': args.repeat,
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+    }
+
+
+def compare(baseline, report, threshold):
+    """Список регрессий относительно эталонного отчёта."""
+    regressions = []
+    for project in PROJECTS:
+        if project not in baseline or project not in report:
+            continue
+        before, after = baseline[project], report[project]
+        for name, result in after['scenarios'].items():
+            old = before['scenarios'].get(name)
+            if old is None:
+                continue
+            if result['queries'] > old['queries']:
+                regressions.append(
+                    f'{project}.{name}: запросов {old["queries"]} '
+                    f'-> {result["queries"]}'
+                )
+            if result['median_ms'] > old['median_ms'] * (1 + threshold):
+                regressions.append(
+                    f'{project}.{name}: медиана {old["median_ms"]} '
+                    f'-> {result["median_ms"]} мс'
+                )
+        old, new = before['load']['total'], after['load']['total']
+        if new['requests_per_second'] < (
+                old['requests_per_second'] * (1 - threshold)):
+            regressions.append(
+                f'{project}.load: {old["requests_per_second"]} '
+                f'-> {new["requests_per_second"]} запросов/с'
+            )
+        if new['p99_ms'] > old['p99_ms'] * (1 + threshold):
+            regressions.append(
+                f'{project}.load: p99 {old["p99_ms"]} -> {new["p99_ms"]} мс'
+            )
+        if new['errors'] > old['errors'] * (1 + threshold):
+            regressions.append(
+                f'{project}.load: ошибок {old["errors"]} -> {new["errors"]}'
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--project', choices=PROJECTS, action='append')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--baseline', type=Path)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='допустимое ухудшение времени, доля')
+    parser.add_argument('--worker', choices=PROJECTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        print(json.dumps(run_project(args.worker, args)))
+        return
+
+    # Django настраивается один раз на процесс, поэтому каждый
+    # проект прогоняется в своём.
+    report = {}
+    for project in args.project or PROJECTS:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.suite', '--worker', project,
+             '--rows', str(args.rows), '--repeat', str(args.repeat),
+             '--requests', str(args.requests),
+             '--concurrency', str(args.concurrency)],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout
+        report[project] = json.loads(output.splitlines()[-1])
+    setup_django(PROJECTS[0])
+    report['meta'] = metadata(args)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text)
+    print(text)
+    if args.baseline:
+        regressions = compare(
+            json.loads(args.baseline.read_text()), report, args.threshold
+        )
+        for line in regressions:
+            print(f'РЕГРЕССИЯ {line}', file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
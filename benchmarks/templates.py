@@ -0,0 +1,115 @@
+"""
+Бенчмарк рендера шаблонов с кеширующим загрузчиком и без него.
+
+Рендерит news/home.html или notes/list.html с движками из настроек
+разработки (шаблон читается и разбирается при каждом запросе)
+и продакшен-профиля (кешированные шаблоны после прогрева). Каждая
+итерация, как и view, получает шаблон по имени и рендерит его.
+Запуск из корня репозитория:
+
+    python -m benchmarks.templates ya_news
+    python -m benchmarks.templates ya_note --repeat 200
+"""
+import argparse
+import importlib
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import measure, setup_django
+from benchmarks.seed import seed_project
+
+PACKAGES = {
+    'ya_news': 'yanews',
+    'ya_note': 'yanote',
+}
+
+PROFILES = {
+    'dev': 'settings.dev',
+    'prod': 'settings.prod',
+}
+
+
+def news_page():
+    from news.views import home_page
+    page = home_page(None)
+    return 'news/home.html', {'object_list': page.object_list, 'page': page}
+
+
+def notes_page():
+    from django.conf import settings
+    from notes.models import Note
+    per_page = settings.NOTES_COUNT_ON_LIST_PAGE
+    notes = list(Note.objects.filter(author_id=1).only(
+        'id', 'slug', 'title'
+    ).order_by('id')[:per_page])
+    return 'notes/list.html', {'object_list': notes, 'next_cursor': None}
+
+
+PAGES = {
+    'ya_news': news_page,
+    'ya_note': notes_page,
+}
+
+
+def make_backend(project, profile):
+    """Движок шаблонов с параметрами TEMPLATES из модуля настроек."""
+    from django.utils.module_loading import import_string
+    module = importlib.import_module(
+        f'{PACKAGES[project]}.{PROFILES[profile]}'
+    )
+    params = dict(module.TEMPLATES[0])
+    options = params['OPTIONS'] = dict(params['OPTIONS'])
+    # Без явного debug движок взял бы DEBUG из уже загруженных настроек.
+    options.setdefault('debug', module.DEBUG)
+    backend = import_string(params.pop('BACKEND'))
+    return backend({**params, 'NAME': profile})
+
+
+def run_profile(backend, name, context, request, repeat):
+    """Первый рендер с разбором шаблонов, затем рендеры после прогрева."""
+    from yacommon.templates import template_names
+
+    def render():
+        return backend.get_template(name).render(context, request)
+
+    first = measure(render, 1)['min_ms']
+    for template in template_names(backend.engine):
+        backend.engine.get_template(template)
+    return {'first_ms': first, **measure(render, repeat)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('project', choices=PACKAGES)
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=500)
+    parser.add_argument('--output', type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(args.project, Path(tmp) / 'bench.sqlite3')
+        from django.contrib.auth import get_user_model
+        from django.test import RequestFactory
+
+        seed_project(args.project, args.rows)
+        name, context = PAGES[args.project]()
+        request = RequestFactory().get('/')
+        request.user = get_user_model().objects.get(pk=1)
+        report = {
+            profile: run_profile(
+                make_backend(args.project, profile), name, context,
+                request, args.repeat
+            )
+            for profile in PROFILES
+        }
+    report['speedup'] = round(
+        report['dev']['median_ms'] / report['prod']['median_ms'], 2
+    )
+    print(json.dumps({name: report}, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps({name: report}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Параллельный запуск проверок обоих проектов.
+
+flake8 и тесты ya_news и ya_note выполняются в отдельных процессах
+одновременно, каждый со своим DJANGO_SETTINGS_MODULE и своей тестовой
+базой. Вывод транслируется построчно с префиксом проверки, в конце
+печатается сводка по JUnit-отчётам pytest и возвращается общий код.
+
+    python run_tests.py
+    python run_tests.py --report report.json -- -k comments
+    python run_tests.py --workers 0
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from xml.etree import ElementTree
+
+BASE_DIR = Path(__file__).resolve().parent
+
+GREEN = '\033[0;32m'
+RED = '\033[0;31m'
+RESET = '\033[0m'
+
+
+class Check:
+    """Одна проверка: команда, её каталог и сообщение при провале."""
+
+    def __init__(self, name, command, cwd=BASE_DIR, env=None,
+                 failure='', junit=None):
+        self.name = name
+        self.command = command
+        self.cwd = cwd
+        self.env = env or {}
+        self.failure = failure
+        self.junit = junit
+        self.returncode = None
+        self.duration = 0.0
+
+    def start(self, lock):
+        self.started = time.perf_counter()
+        self.process = subprocess.Popen(
+            self.command, cwd=self.cwd, env={**os.environ, **self.env},
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+            bufsize=1
+        )
+        self.reader = threading.Thread(target=self.stream, args=(lock,))
+        self.reader.start()
+
+    def stream(self, lock):
+        for line in self.process.stdout:
+            with lock:
+                print(f'[{self.name}] {line}', end='', flush=True)
+
+    def wait(self):
+        self.reader.join()
+        self.returncode = self.process.wait()
+        self.duration = time.perf_counter() - self.started
+        return self.returncode
+
+    def summary(self):
+        result = {
+            'returncode': self.returncode,
+            'duration_s': round(self.duration, 2),
+        }
+        if self.junit and self.junit.exists():
+            suite = ElementTree.parse(self.junit).getroot()
+            if suite.tag == 'testsuites':
+                suite = suite[0]
+            for key in ('tests', 'failures', 'errors', 'skipped'):
+                result[key] = int(suite.get(key, 0))
+        return result
+
+
+def print_message(message, failed=False):
+    """Строка на всю ширину терминала, как в run_tests.sh."""
+    width = max(len(message), shutil.get_terminal_size().columns)
+    color = RED if failed else GREEN
+    print(f'{color}{message.center(width, "=")}{RESET}', file=sys.stderr)
+
+
+def pytest_check(name, project, settings, reports, workers, pytest_args):
+    junit = reports / f'{project}.xml'
+    # Тесты идут через pytest-xdist, чтобы проверять, что наборы
+    # не ломаются при параллельном запуске.
+    xdist = ['-n', str(workers)] if workers else []
+    return Check(
+        name,
+        [sys.executable, '-m', 'pytest', '--tb=line',
+         f'--junitxml={junit}', *xdist, *pytest_args],
+        cwd=BASE_DIR / project,
+        env={'DJANGO_SETTINGS_MODULE': settings},
+        failure=(
+            f' При запуске упали ваши тесты для проекта {name}. '
+            'Проверьте тесты этого проекта '
+        ),
+        junit=junit,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--report', type=Path,
+                        help='куда сохранить сводку в JSON')
+    parser.add_argument('--workers', type=int, default=2,
+                        help='воркеров pytest-xdist на набор, 0 — без xdist')
+    parser.add_argument('pytest_args', nargs='*',
+                        help='аргументы для обоих запусков pytest')
+    args = parser.parse_args()
+
+    structure = subprocess.run([sys.executable, 'structure_test.py'],
+                               cwd=BASE_DIR)
+    if structure.returncode:
+        print_message(' Убедитесь, что написанные вами тесты скопированы '
+                      'в указанные в ТЗ директории ', failed=True)
+        return structure.returncode
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reports = Path(tmp)
+        checks = [
+            Check('flake8',
+                  [sys.executable, '-m', 'flake8', '--config=setup.cfg'],
+                  failure=(' flake8 обнаружил отклонения от стандартов, '
+                           'приведите код в соответствие с PEP8 ')),
+            pytest_check('YaNews', 'ya_news', 'yanews.settings', reports,
+                         args.workers, args.pytest_args),
+            pytest_check('YaNote', 'ya_note', 'yanote.settings', reports,
+                         args.workers, args.pytest_args),
+        ]
+        lock = threading.Lock()
+        for check in checks:
+            check.start(lock)
+        for check in checks:
+            check.wait()
+        report = {check.name: check.summary() for check in checks}
+
+    print(json.dumps(report, indent=2, ensure_ascii=False), file=sys.stderr)
+    if args.report:
+        args.report.write_text(json.dumps(report, indent=2))
+    failed = [check for check in checks if check.returncode]
+    for check in failed:
+        print_message(check.failure, failed=True)
+    if failed:
+        return failed[0].returncode
+    print_message(' Все проверки пройдены ')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,41 @@
-from datetime import datetime, timedelta
+import os
+from datetime import timedelta
 
 import pytest
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
-from django.utils import timezone
 
 from news.models import Comment, News
+from news.pytest_tests.factories import make_comments, make_news
+from yacommon.auth import user_cache
+from yacommon.testing import make_users
+
+# Тесты импортируют продакшен-профиль, которому нужен ключ из окружения.
+os.environ.setdefault('DJANGO_SECRET_KEY', 'test-secret-key')
 
 COMMENT_TEXT = 'Текст комментария новый'
 
+VOLUME_USERS = 50
+VOLUME_NEWS = 200
+VOLUME_COMMENTS = 5000
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Очищаем кеши, чтобы тесты не видели данные друг друга."""
+    cache.clear()
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings):
+    """Превышение бюджета запросов в тестах — ошибка, а не запись в лог."""
+    settings.QUERY_BUDGET_ACTION = 'raise'
+
 
 @pytest.fixture
 def author(django_user_model):
@@ -43,26 +70,34 @@ def comment(author, news):
 @pytest.fixture
 def news_for_sort(author):
     """Создаем одинадцать новостей."""
-    today = datetime.today()
-    news_for_pagination = News.objects.bulk_create(
-        News(title=f'Новость {index}',
-             text='Просто текст.',
-             date=today - timedelta(days=index))
-        for index in range(settings.NEWS_COUNT_ON_HOME_PAGE + 1))
-    return news_for_pagination
+    return make_news(settings.NEWS_COUNT_ON_HOME_PAGE + 1)
 
 
 @pytest.fixture
 def comment_for_sort(author, news):
     """Создаем два комментария."""
-    now = timezone.now()
-    for index in range(2):
-        comment_for_sort = Comment.objects.create(
-            news=news, author=author, text=f'Tекст {index}',
-        )
-        comment_for_sort.created = now + timedelta(days=index)
-        comment_for_sort.save()
-    return comment_for_sort
+    comments = make_comments(news, [author], 2, text='Tекст {index}',
+                             step=timedelta(days=1))
+    return comments[-1]
+
+
+@pytest.fixture(scope='module')
+def news_volume(django_db_setup, django_db_blocker):
+    """
+    Объёмные данные, общие для всех тестов модуля.
+
+    Создаются один раз в обход транзакций тестов: каждый тест получает
+    их как исходное состояние базы и откатывает свои изменения,
+    после модуля данные удаляются.
+    """
+    with django_db_blocker.unblock():
+        users = make_users(VOLUME_USERS, prefix='volume')
+        news = make_news(VOLUME_NEWS)
+        make_comments(news[0], users, VOLUME_COMMENTS)
+    yield news
+    with django_db_blocker.unblock():
+        News.objects.filter(pk__in=[item.pk for item in news]).delete()
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
 
 
 @pytest.fixture
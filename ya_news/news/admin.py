@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Comment, News
+from .models import BannedWord, Comment, News
 
 
 class CommentInline(admin.StackedInline):
@@ -13,3 +13,15 @@ class NewsAdmin(admin.ModelAdmin):
     inlines = [
         CommentInline,
     ]
+    list_display = ('title', 'date', 'comment_count')
+    readonly_fields = ('comment_count',)
+
+    def save_related(self, request, form, formsets, change):
+        """После сохранения инлайнов сверяем счётчик комментариев."""
+        super().save_related(request, form, formsets, change)
+        News.objects.refresh_comment_count((form.instance.pk,))
+
+
+@admin.register(BannedWord)
+class BannedWordAdmin(admin.ModelAdmin):
+    search_fields = ('word',)
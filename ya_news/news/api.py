@@ -0,0 +1,103 @@
+"""
+JSON API только для чтения: лента новостей и комментарии к новости.
+
+Строки выбираются через values(), без создания объектов моделей,
+и сразу сериализуются в JSON.
+"""
+import json
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.views import generic
+
+from .models import Comment, News
+from .pagination import KeysetPaginator
+from .views import CURSOR
+
+NEWS_FIELDS = ('id', 'title', 'text', 'date', 'comment_count')
+COMMENT_FIELDS = ('id', 'text', 'created', 'author__username')
+
+
+def _default(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} не сериализуется в JSON')
+
+
+def json_response(data):
+    return HttpResponse(
+        json.dumps(data, ensure_ascii=False, default=_default),
+        content_type='application/json; charset=utf-8'
+    )
+
+
+class KeysetListAPI(ABC, generic.View):
+    """Страница строк после курсора и ссылка на следующую."""
+    ordering = None
+
+    @abstractmethod
+    def get_queryset(self):
+        """Выборка values() в порядке ordering."""
+
+    @abstractmethod
+    def get_per_page(self):
+        """Размер страницы; читается из настроек на каждый запрос."""
+
+    def get_page(self):
+        paginator = KeysetPaginator(
+            self.get_queryset(), self.ordering, self.get_per_page()
+        )
+        return paginator.page(self.request.GET.get(CURSOR))
+
+    def get(self, request, *args, **kwargs):
+        page = self.get_page()
+        next_url = None
+        if page.has_next:
+            query = urlencode({CURSOR: page.next_cursor})
+            next_url = f'{request.path}?{query}'
+        return json_response({'results': page.object_list, 'next': next_url})
+
+
+class NewsListAPI(KeysetListAPI):
+    """Лента новостей в том же порядке, что и на главной."""
+    ordering = ('-date', '-id')
+
+    def get_queryset(self):
+        return News.objects.values(*NEWS_FIELDS)
+
+    def get_per_page(self):
+        return settings.NEWS_COUNT_ON_HOME_PAGE
+
+    def get_page(self):
+        page = super().get_page()
+        for row in page.object_list:
+            row['comments'] = reverse(
+                'news:api_comments', kwargs={'pk': row['id']}
+            )
+        return page
+
+
+class CommentListAPI(KeysetListAPI):
+    """Комментарии к новости от старых к новым."""
+    ordering = ('created', 'id')
+
+    def get_queryset(self):
+        return Comment.objects.filter(
+            news_id=self.kwargs['pk']
+        ).values(*COMMENT_FIELDS)
+
+    def get_per_page(self):
+        return settings.COMMENTS_COUNT_ON_DETAIL_PAGE
+
+    def get_page(self):
+        """Новость проверяем отдельным запросом, только если страница пуста."""
+        page = super().get_page()
+        if not page.object_list and not News.objects.filter(
+                pk=self.kwargs['pk']).exists():
+            raise Http404('Новость не найдена.')
+        for row in page.object_list:
+            row['author'] = row.pop('author__username')
+        return page
@@ -0,0 +1,17 @@
+"""Маршруты news для ASGI: читающие страницы асинхронные, остальные общие."""
+from django.urls import path
+
+from news import async_views, urls
+
+app_name = 'news'
+
+ASYNC_VIEWS = {
+    'home': async_views.news_list,
+    'detail': async_views.news_detail,
+}
+
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name], name=pattern.name)
+    if pattern.name in ASYNC_VIEWS else pattern
+    for pattern in urls.urlpatterns
+]
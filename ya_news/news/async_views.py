@@ -0,0 +1,103 @@
+"""
+Асинхронные варианты читающих страниц для развёртывания через yanews.asgi.
+
+ORM и кеш в Django 3.2 синхронные, поэтому всё обращение к БД и кешу
+за один запрос выполняется одним вызовом sync_to_async, а шаблон
+рендерится уже в цикле событий по загруженным данным.
+"""
+from calendar import timegm
+from http import HTTPStatus
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponseNotAllowed
+from django.shortcuts import get_object_or_404, render
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import home_page_key, news_cache
+from .forms import CommentForm
+from .models import News
+from .views import (
+    CURSOR, NewsComment, NewsDetail, NewsList, comments_fragment, home_etag,
+    home_modified, home_page, without_cookies
+)
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def render_home(request, page):
+    return render(request, NewsList.template_name, {
+        'object_list': page.object_list,
+        'page': page,
+    })
+
+
+@sync_to_async
+def load_home(request):
+    """
+    Условный ответ, ответ из кеша или страница ленты.
+
+    Пользователь загружается здесь же, чтобы шаблон не обращался
+    к сессии из асинхронного кода. Страницу для анонимов рендерим
+    тоже здесь: её, как и в NewsList, после сброса кеша строит
+    один из процессов, делящих кеш.
+    """
+    authenticated = request.user.is_authenticated
+    etag = quote_etag(home_etag(request))
+    modified = home_modified(request)
+    last_modified = timegm(modified.utctimetuple()) if modified else None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    page = None
+    cursor = request.GET.get(CURSOR)
+    if response is None and authenticated:
+        page = home_page(cursor)
+    elif response is None:
+        response = news_cache.get_or_set(
+            home_page_key(cursor),
+            lambda: render_home(request, home_page(cursor)),
+            settings.NEWS_FRAGMENT_CACHE_TIMEOUT,
+            cacheable=without_cookies
+        )
+    return response, page, etag, last_modified
+
+
+@sync_to_async
+def load_detail(request, pk):
+    request.user.is_authenticated  # Загружаем пользователя в этом потоке.
+    news = get_object_or_404(News, pk=pk)
+    return news, comments_fragment(news, request.GET.get(CURSOR))
+
+
+async def news_list(request):
+    """Лента новостей с теми же кешем и ETag, что и у NewsList."""
+    if request.method not in SAFE_METHODS:
+        return HttpResponseNotAllowed(SAFE_METHODS)
+    response, page, etag, last_modified = await load_home(request)
+    if page is not None:
+        response = render_home(request, page)
+    if response.status_code == HTTPStatus.OK:
+        # Закешированную страницу могла положить и синхронная NewsList.
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        response['ETag'] = etag
+    return response
+
+
+async def news_detail(request, pk):
+    """Страница новости; отправка комментария остаётся синхронной."""
+    if request.method == 'POST':
+        return await sync_to_async(NewsComment.as_view())(request, pk=pk)
+    if request.method not in SAFE_METHODS:
+        return HttpResponseNotAllowed(SAFE_METHODS + ('POST',))
+    news, fragment = await load_detail(request, pk)
+    context = {
+        'object': news,
+        'news': news,
+        'comments': fragment.for_user(request.user),
+    }
+    if request.user.is_authenticated:
+        context['form'] = CommentForm()
+    return render(request, NewsDetail.template_name, context)
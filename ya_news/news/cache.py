@@ -0,0 +1,137 @@
+"""Кеш отрендеренных страниц и фрагментов новостей с версионированием."""
+import hashlib
+import re
+from datetime import datetime
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from yacommon.cache import CacheNamespace, invalidation
+
+COMMENTS_VERSION_KEY = '{pk}:comments:version'
+COMMENTS_FRAGMENT_KEY = '{pk}:comments:{version}:{per_page}:{cursor}'
+COMMENT_ACTIONS = re.compile(r'<!--comment-actions:(\d+):(\d+)-->')
+HOME_VERSION_KEY = 'home:version'
+HOME_MODIFIED_KEY = 'home:modified'
+HOME_PAGE_KEY = 'home:{version}:{cursor}'
+BANNED_WORDS_VERSION_KEY = 'banned_words:version'
+
+news_cache = CacheNamespace('news')
+
+
+def _cursor_hash(cursor):
+    return hashlib.md5((cursor or '').encode()).hexdigest()
+
+
+def comments_version(news_pk):
+    return news_cache.version(COMMENTS_VERSION_KEY.format(pk=news_pk))
+
+
+@invalidation
+def bump_comments_version(news_pk):
+    news_cache.bump(COMMENTS_VERSION_KEY.format(pk=news_pk))
+
+
+def comments_fragment_key(news_pk, cursor):
+    return COMMENTS_FRAGMENT_KEY.format(
+        pk=news_pk,
+        version=comments_version(news_pk),
+        per_page=settings.COMMENTS_COUNT_ON_DETAIL_PAGE,
+        cursor=_cursor_hash(cursor),
+    )
+
+
+def banned_words_version():
+    return news_cache.version(BANNED_WORDS_VERSION_KEY)
+
+
+@invalidation
+def bump_banned_words_version():
+    """Словарь изменился: процессы с этим кешем пересоберут автоматы."""
+    news_cache.bump(BANNED_WORDS_VERSION_KEY)
+
+
+def home_version():
+    return news_cache.version(HOME_VERSION_KEY)
+
+
+@invalidation
+def bump_home_version():
+    """Лента новостей изменилась: сбрасываем кеш и обновляем её дату."""
+    news_cache.bump(HOME_VERSION_KEY)
+    news_cache.set(HOME_MODIFIED_KEY, timezone.now(), None)
+
+
+def home_page_key(cursor):
+    return HOME_PAGE_KEY.format(
+        version=home_version(), cursor=_cursor_hash(cursor)
+    )
+
+
+def home_last_modified():
+    """
+    Время последнего изменения ленты новостей.
+
+    Пока в кеше нет отметки о записи, берём самую свежую из дат
+    новостей и комментариев; оба запроса идут по индексам.
+    """
+    modified = news_cache.get(HOME_MODIFIED_KEY)
+    if modified is not None:
+        return modified
+    from .models import Comment, News
+    candidates = []
+    newest_date = News.objects.order_by('-date').values_list(
+        'date', flat=True
+    ).first()
+    if newest_date is not None:
+        candidates.append(timezone.make_aware(
+            datetime.combine(newest_date, datetime.min.time())
+        ))
+    newest_comment = Comment.objects.order_by('-pk').values_list(
+        'created', flat=True
+    ).first()
+    if newest_comment is not None:
+        candidates.append(newest_comment)
+    if not candidates:
+        return None
+    modified = max(candidates)
+    news_cache.add(HOME_MODIFIED_KEY, modified, None)
+    return modified
+
+
+class CommentsFragment:
+    """
+    Общий для всех читателей HTML страницы комментариев.
+
+    Ссылки редактирования и удаления в кеш не попадают: вместо них
+    в разметке стоят маркеры с id комментария и автора, которые
+    for_user() заменяет ссылками только для комментариев читателя.
+    """
+
+    def __init__(self, html, next_cursor):
+        self.html = html
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def for_user(self, user):
+        def actions(match):
+            comment_pk, author_pk = match.groups()
+            if str(user.pk) != author_pk:
+                return ''
+            return format_html(
+                '<a href="{}">Редактировать</a> |\n'
+                '<a href="{}">Удалить</a>',
+                reverse('news:edit', args=(comment_pk,)),
+                reverse('news:delete', args=(comment_pk,)),
+            )
+
+        return CommentsFragment(
+            mark_safe(COMMENT_ACTIONS.sub(actions, self.html)),
+            self.next_cursor
+        )
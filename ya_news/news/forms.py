@@ -1,7 +1,9 @@
 from django.core.exceptions import ValidationError
 from django.forms import ModelForm
 
-from .models import Comment
+from .cache import banned_words_version
+from .models import BannedWord, Comment
+from .profanity import BadWordsMatcher
 
 BAD_WORDS = (
     'редиска',
@@ -11,6 +13,32 @@ BAD_WORDS = (
 WARNING = 'Не ругайтесь!'
 
 
+class BadWordsCache:
+    """
+    Скомпилированный словарь запрещённых слов текущего процесса.
+
+    Автомат пересобирается из BAD_WORDS и модели BannedWord, только
+    когда меняется версия словаря в кеше, так что проверка комментария
+    не делает запросов к базе. Сброс версии видят только процессы,
+    которые делят один кеш: с LocMemCache это лишь текущий процесс.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.matcher = None
+
+    def get_matcher(self):
+        version = banned_words_version()
+        if self.matcher is None or version != self.version:
+            words = BannedWord.objects.values_list('word', flat=True)
+            self.matcher = BadWordsMatcher((*BAD_WORDS, *words))
+            self.version = version
+        return self.matcher
+
+
+bad_words = BadWordsCache()
+
+
 class CommentForm(ModelForm):
 
     class Meta:
@@ -20,8 +48,6 @@ class CommentForm(ModelForm):
     def clean_text(self):
         """Не позволяем ругаться в комментариях."""
         text = self.cleaned_data['text']
-        lowered_text = text.lower()
-        for word in BAD_WORDS:
-            if word in lowered_text:
-                raise ValidationError(WARNING)
+        if text in bad_words.get_matcher():
+            raise ValidationError(WARNING)
         return text
@@ -0,0 +1,53 @@
+"""
+Схема полнотекстовых индексов новостей и комментариев в SQLite.
+
+Используется поиском и командой rebuild_search_index. Миграции
+хранят свою, зафиксированную копию этих SQL.
+"""
+SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_news_fts USING fts5("
+    "title, text, content='news_news', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS news_news_fts_insert "
+    "AFTER INSERT ON news_news BEGIN "
+    "INSERT INTO news_news_fts(rowid, title, text) "
+    "VALUES (new.id, new.title, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS news_news_fts_delete "
+    "AFTER DELETE ON news_news BEGIN "
+    "INSERT INTO news_news_fts(news_news_fts, rowid, title, text) "
+    "VALUES ('delete', old.id, old.title, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS news_news_fts_update "
+    "AFTER UPDATE OF title, text ON news_news BEGIN "
+    "INSERT INTO news_news_fts(news_news_fts, rowid, title, text) "
+    "VALUES ('delete', old.id, old.title, old.text); "
+    "INSERT INTO news_news_fts(rowid, title, text) "
+    "VALUES (new.id, new.title, new.text); END",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS news_comment_fts USING fts5("
+    "text, content='news_comment', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS news_comment_fts_insert "
+    "AFTER INSERT ON news_comment BEGIN "
+    "INSERT INTO news_comment_fts(rowid, text) "
+    "VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS news_comment_fts_delete "
+    "AFTER DELETE ON news_comment BEGIN "
+    "INSERT INTO news_comment_fts(news_comment_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS news_comment_fts_update "
+    "AFTER UPDATE OF text ON news_comment BEGIN "
+    "INSERT INTO news_comment_fts(news_comment_fts, rowid, text) "
+    "VALUES ('delete', old.id, old.text); "
+    "INSERT INTO news_comment_fts(rowid, text) "
+    "VALUES (new.id, new.text); END",
+)
+
+TABLES = ('news_news_fts', 'news_comment_fts')
+
+REBUILD = tuple(
+    f"INSERT INTO {table}({table}) VALUES ('rebuild')" for table in TABLES
+)
+
+# rank = 1 сверяет индекс с содержимым таблиц, а не только
+# его внутреннюю структуру.
+INTEGRITY_CHECK = tuple(
+    f"INSERT INTO {table}({table}, rank) VALUES ('integrity-check', 1)"
+    for table in TABLES
+)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from news.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Пересоздаёт полнотекстовый индекс новостей и комментариев.'
+
+    def handle(self, *args, **options):
+        if rebuild_search_index():
+            self.stdout.write(self.style.SUCCESS('Индекс новостей обновлён.'))
+        else:
+            self.stdout.write('Полнотекстовый индекс есть только в SQLite.')
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from news.models import News
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает денормализованный счётчик комментариев новостей.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'news_ids', nargs='*', type=int,
+            help='id новостей; по умолчанию пересчитываются все.'
+        )
+
+    def handle(self, *args, **options):
+        news_ids = options['news_ids'] or None
+        updated = News.objects.refresh_comment_count(news_ids)
+        self.stdout.write(
+            self.style.SUCCESS(f'Обновлено новостей: {updated}')
+        )
@@ -2,15 +2,63 @@ from datetime import datetime
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .cache import bump_comments_version, bump_home_version
+
+
+class NewsQuerySet(models.QuerySet):
+    """Массовые операции с новостями сбрасывают кеш ленты."""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        bump_home_version()
+        return objs
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        bump_home_version()
+        return rows
+
+    def delete(self):
+        result = super().delete()
+        bump_home_version()
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def refresh_comment_count(self, news_ids=None):
+        """
+        Пересчитываем счётчик комментариев одним UPDATE.
+
+        Если news_ids не переданы, пересчитываются все новости выборки.
+        """
+        queryset = self if news_ids is None else self.filter(pk__in=news_ids)
+        comments = Comment.objects.filter(
+            news=OuterRef('pk')
+        ).order_by().values('news').annotate(
+            total=Count('pk')
+        ).values('total')
+        return queryset.update(
+            comment_count=Coalesce(Subquery(comments), 0)
+        )
 
 
 class News(models.Model):
     title = models.CharField(max_length=50)
     text = models.TextField()
     date = models.DateField(default=datetime.today)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = NewsQuerySet.as_manager()
 
     class Meta:
         ordering = ('-date',)
+        indexes = (
+            models.Index(fields=('date', 'id'), name='news_date_id_idx'),
+        )
         verbose_name_plural = 'Новости'
         verbose_name = 'Новость'
 
@@ -18,6 +66,45 @@ class News(models.Model):
         return self.title
 
 
+class CommentQuerySet(models.QuerySet):
+    """
+    Массовые операции, сохраняющие News.comment_count актуальным.
+
+    Сигналы при них не отправляются, поэтому кеш комментариев
+    затронутых новостей сбрасывается здесь же.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        self._comments_changed({obj.news_id for obj in objs})
+        return objs
+
+    def update(self, **kwargs):
+        if 'news' not in kwargs and 'news_id' not in kwargs:
+            return super().update(**kwargs)
+        news_ids = set(self.values_list('news_id', flat=True))
+        rows = super().update(**kwargs)
+        news = kwargs.get('news', kwargs.get('news_id'))
+        news_ids.add(getattr(news, 'pk', news))
+        self._comments_changed(news_ids)
+        return rows
+
+    def delete(self):
+        news_ids = set(self.values_list('news_id', flat=True))
+        result = super().delete()
+        self._comments_changed(news_ids)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    @staticmethod
+    def _comments_changed(news_ids):
+        News.objects.refresh_comment_count(news_ids)
+        for news_id in news_ids:
+            bump_comments_version(news_id)
+
+
 class Comment(models.Model):
     news = models.ForeignKey(
         News,
@@ -30,8 +117,47 @@ class Comment(models.Model):
     text = models.TextField()
     created = models.DateTimeField(auto_now_add=True)
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         ordering = ('created',)
+        indexes = (
+            models.Index(
+                fields=('news', 'created'), name='comment_news_created_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text[:50]
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            News.objects.filter(pk=self.news_id).update(
+                comment_count=F('comment_count') + 1
+            )
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        News.objects.filter(pk=self.news_id, comment_count__gt=0).update(
+            comment_count=F('comment_count') - 1
+        )
+        return result
+
+
+class BannedWord(models.Model):
+    """Запрещённое слово, которое модераторы добавляют через админку."""
+    word = models.CharField('Слово', max_length=100, unique=True)
+
+    class Meta:
+        ordering = ('word',)
+        verbose_name_plural = 'Запрещённые слова'
+        verbose_name = 'Запрещённое слово'
+
+    def __str__(self):
+        return self.word
+
+    def save(self, *args, **kwargs):
+        self.word = self.word.strip().lower()
+        super().save(*args, **kwargs)
@@ -0,0 +1,96 @@
+"""Курсорная (keyset) пагинация по упорядоченному набору полей."""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404
+
+
+class KeysetPage:
+    """Страница выборки и курсор для перехода к следующей."""
+
+    def __init__(self, object_list, next_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginator:
+    """
+    Пагинация «после курсора» вместо OFFSET.
+
+    ordering — поля сортировки, последнее из которых уникально
+    (обычно id), например ('-date', '-id'). Курсор хранит значения
+    этих полей у последнего объекта страницы, поэтому любая страница
+    выбирается по индексу так же быстро, как первая.
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = per_page
+        self.fields = [
+            (queryset.model._meta.get_field(name.lstrip('-')),
+             name.startswith('-'))
+            for name in ordering
+        ]
+
+    def page(self, cursor=None):
+        """Возвращаем страницу, следующую за курсором."""
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self._after(self.decode(cursor)))
+        object_list = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.encode(object_list[-1])
+        return KeysetPage(object_list, next_cursor)
+
+    def encode(self, obj):
+        """Курсор строится и по объекту модели, и по словарю из values()."""
+        if isinstance(obj, dict):
+            values = [obj[field.attname] for field, _ in self.fields]
+        else:
+            values = [getattr(obj, field.attname) for field, _ in self.fields]
+        values = [self._serialize(value) for value in values]
+        return base64.urlsafe_b64encode(
+            json.dumps(values).encode()
+        ).decode()
+
+    def decode(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self.fields):
+                raise ValueError
+            return [
+                field.to_python(value)
+                for (field, _), value in zip(self.fields, values)
+            ]
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise Http404('Некорректный курсор страницы.')
+
+    def _after(self, values):
+        condition = Q()
+        equal = {}
+        for (field, descending), value in zip(self.fields, values):
+            lookup = 'lt' if descending else 'gt'
+            condition |= Q(**equal, **{f'{field.attname}__{lookup}': value})
+            equal[field.attname] = value
+        return condition
+
+    @staticmethod
+    def _serialize(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
@@ -0,0 +1,83 @@
+"""Поиск запрещённых слов за один проход по тексту (Ахо — Корасик)."""
+from collections import deque
+
+# Латинские буквы, которыми подменяют похожие кириллические.
+HOMOGLYPHS = str.maketrans('aeopcxykmthbё', 'аеорсхукмтнве')
+
+
+class BadWordsMatcher:
+    """
+    Автомат Ахо — Корасик для набора запрещённых слов.
+
+    Строится один раз, после чего проверка текста занимает время,
+    пропорциональное его длине, независимо от размера словаря.
+    whole_words — искать только целые слова, а не подстроки;
+    homoglyphs — считать латинские «а», «е», «о»… кириллическими.
+    """
+
+    def __init__(self, words, whole_words=False, homoglyphs=True):
+        self.whole_words = whole_words
+        self.homoglyphs = homoglyphs
+        self._goto = [{}]
+        self._fail = [0]
+        # Длины слов, которые заканчиваются в узле, с учётом суффиксов.
+        self._output = [()]
+        for word in words:
+            self._add(self.normalize(word))
+        self._link()
+
+    def normalize(self, text):
+        text = text.lower()
+        if self.homoglyphs:
+            text = text.translate(HOMOGLYPHS)
+        return text
+
+    def _add(self, word):
+        if not word:
+            return
+        node = 0
+        for char in word:
+            if char not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[node][char] = len(self._goto) - 1
+            node = self._goto[node][char]
+        self._output[node] = (len(word),)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] += self._output[self._fail[child]]
+
+    def search(self, text):
+        """Первое найденное запрещённое слово или None."""
+        text = self.normalize(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length in output[node]:
+                start = end - length + 1
+                if not self.whole_words or self._is_word(text, start, end):
+                    return text[start:end + 1]
+        return None
+
+    def __contains__(self, text):
+        return self.search(text) is not None
+
+    @staticmethod
+    def _is_word(text, start, end):
+        return (
+            (start == 0 or not text[start - 1].isalnum())
+            and (end + 1 == len(text) or not text[end + 1].isalnum())
+        )
@@ -0,0 +1,39 @@
+"""Фабрики новостей и комментариев: пачками через bulk_create."""
+from datetime import date, timedelta
+
+from django.utils import timezone
+
+from news.models import Comment, News
+from yacommon.testing import BATCH_SIZE, bulk_create
+
+
+def make_news(count, start=None, step=timedelta(days=1)):
+    """Создаём count новостей, каждую следующую на step старше."""
+    start = start or date.today()
+    return bulk_create(News, (
+        News(title=f'Новость {index}',
+             text='Просто текст.',
+             date=start - step * index)
+        for index in range(count)
+    ))
+
+
+def make_comments(news, authors, count, text='Текст {index}', start=None,
+                  step=timedelta(minutes=1)):
+    """
+    Создаём count комментариев к news от authors по очереди.
+
+    Время создания растёт на step. auto_now_add ставит время вставки,
+    поэтому заданное время записываем вторым проходом bulk_update.
+    """
+    start = start or timezone.now()
+    comments = bulk_create(Comment, (
+        Comment(news=news,
+                author=authors[index % len(authors)],
+                text=text.format(index=index))
+        for index in range(count)
+    ))
+    for index, comment in enumerate(comments):
+        comment.created = start + step * index
+    Comment.objects.bulk_update(comments, ('created',), batch_size=BATCH_SIZE)
+    return comments
@@ -0,0 +1,80 @@
+"""Тестирование JSON API."""
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from django.conf import settings
+from django.urls import reverse
+
+from news.api import KeysetListAPI
+from news.models import Comment
+from news.views import CURSOR
+
+pytestmark = pytest.mark.django_db
+
+
+def test_news_api_matches_home_order(client, news_for_sort,
+                                     django_assert_num_queries):
+    """Тест лента отдаётся одним запросом и листается курсором."""
+    url = reverse('news:api_news')
+    with django_assert_num_queries(1):
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert len(data['results']) == settings.NEWS_COUNT_ON_HOME_PAGE
+    dates = [row['date'] for row in data['results']]
+    assert dates == sorted(dates, reverse=True)
+    first = data['results'][0]
+    assert set(first) == {'id', 'title', 'text', 'date', 'comment_count',
+                          'comments'}
+    assert first['comments'] == reverse('news:api_comments',
+                                        kwargs={'pk': first['id']})
+    next_url = urlsplit(data['next'])
+    assert next_url.path == url
+    assert list(parse_qs(next_url.query)) == [CURSOR]
+    data = client.get(data['next']).json()
+    assert len(data['results']) == 1
+    assert data['next'] is None
+
+
+def test_comments_api(client, author, news, comment_for_sort):
+    """Тест комментарии от старых к новым с именем автора."""
+    url = reverse('news:api_comments', kwargs={'pk': news.pk})
+    data = client.get(url).json()
+    assert [row['text'] for row in data['results']] == ['Tекст 0', 'Tекст 1']
+    assert data['results'][0]['author'] == author.username
+    assert data['next'] is None
+
+
+def test_comments_api_pagination(settings, client, author, news):
+    """Тест комментарии листаются курсором без пропусков."""
+    settings.COMMENTS_COUNT_ON_DETAIL_PAGE = 2
+    for index in range(5):
+        Comment.objects.create(news=news, author=author, text=f'Текст {index}')
+    url = reverse('news:api_comments', kwargs={'pk': news.pk})
+    texts = []
+    while url:
+        data = client.get(url).json()
+        texts += [row['text'] for row in data['results']]
+        url = data['next']
+    assert texts == [f'Текст {index}' for index in range(5)]
+
+
+def test_comments_api_unknown_news(client, news):
+    """Тест для несуществующей новости 404, для пустой — пустой список."""
+    url = reverse('news:api_comments', kwargs={'pk': news.pk + 1})
+    assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+    url = reverse('news:api_comments', kwargs={'pk': news.pk})
+    assert client.get(url).json() == {'results': [], 'next': None}
+
+
+def test_api_bad_cursor(client):
+    """Тест испорченный курсор — 404."""
+    response = client.get(reverse('news:api_news'), {'cursor': 'bad'})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_keyset_api_is_abstract():
+    """Тест без выборки и размера страницы базовый класс не создаётся."""
+    with pytest.raises(TypeError):
+        KeysetListAPI()
@@ -0,0 +1,80 @@
+"""Тестирование асинхронных страниц, которые подключает yanews.asgi."""
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.test import AsyncClient, RequestFactory
+from django.urls import reverse
+from pytest_django.asserts import assertRedirects
+
+from news.async_views import news_list
+from news.forms import CommentForm
+from news.models import Comment
+from yanews.asgi import application
+
+pytestmark = [pytest.mark.django_db, pytest.mark.urls('yanews.asgi_urls')]
+
+
+def test_async_home_page(client, news_for_sort, django_assert_num_queries):
+    """Тест лента та же, что у синхронной страницы, и одним запросом."""
+    with django_assert_num_queries(1):
+        response = client.get(reverse('news:home'))
+    object_list = response.context['object_list']
+    assert len(object_list) == settings.NEWS_COUNT_ON_HOME_PAGE
+    dates = [news.date for news in object_list]
+    assert dates == sorted(dates, reverse=True)
+    assert response.context['page'].has_next
+
+
+def test_async_home_conditional_and_cache(client, news,
+                                          django_assert_num_queries):
+    """Тест ETag даёт 304, повторный анонимный запрос идёт из кеша."""
+    url = reverse('news:home')
+    response = client.get(url)
+    with django_assert_num_queries(0):
+        cached = client.get(url)
+    assert cached.content == response.content
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_async_detail_page(author_client, author, comment, detail_url):
+    """Тест страница новости с комментариями и формой."""
+    response = author_client.get(detail_url)
+    assert response.status_code == HTTPStatus.OK
+    assert comment.text in response.content.decode()
+    assert isinstance(response.context['form'], CommentForm)
+
+
+def test_async_detail_missing_news(client, news):
+    url = reverse('news:detail', args=(news.pk + 1,))
+    assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+
+def test_async_detail_post_comment(author_client, news, form_data,
+                                   detail_url):
+    """Тест отправка комментария обрабатывается синхронным представлением."""
+    response = author_client.post(detail_url, data=form_data)
+    assertRedirects(response, f'{detail_url}#comments')
+    assert Comment.objects.get().text == form_data['text']
+
+
+def test_async_middleware_counts_queries(news):
+    """Тест под ASGI middleware считает запросы, выполненные в потоке."""
+    async def get():
+        return await AsyncClient().get(reverse('news:home'))
+
+    response = async_to_sync(get)()
+    assert response.status_code == HTTPStatus.OK
+    assert 'desc="1 queries"' in response['Server-Timing']
+
+
+@pytest.mark.urls('yanews.urls')
+def test_asgi_application_routes_to_async_pages(news):
+    """Тест точка входа ASGI ведёт в асинхронные страницы сама."""
+    assert settings.ROOT_URLCONF == 'yanews.urls'
+    request = RequestFactory().get(reverse('news:home'))
+    response = async_to_sync(application.get_response_async)(request)
+    assert response.status_code == HTTPStatus.OK
+    assert request.resolver_match.func is news_list
@@ -0,0 +1,108 @@
+"""Тестирование общего слоя кеширования."""
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+
+from news.cache import banned_words_version
+from news.models import BannedWord
+from yacommon.cache import CacheNamespace, cache_stats
+
+VALUE = 'значение'
+
+
+@pytest.fixture
+def namespace():
+    return CacheNamespace('test', lock_timeout=1, lock_wait=0.01)
+
+
+def test_keys_are_namespaced(namespace):
+    """Тест ключи пространства лежат в кеше с его префиксом."""
+    namespace.set('key', VALUE)
+    assert cache.get('test:key') == VALUE
+    assert namespace.get('key') == VALUE
+
+
+def test_hits_and_misses_are_counted(namespace):
+    """Тест попадания и промахи считаются по пространству."""
+    assert namespace.get('key') is None
+    namespace.set('key', VALUE)
+    namespace.get('key')
+    assert cache_stats()['test'] == {'hits': 1, 'misses': 1}
+
+
+def test_bump_changes_version(namespace):
+    """Тест после сброса версия набора данных другая."""
+    version = namespace.version('version')
+    assert namespace.version('version') == version
+    namespace.bump('version')
+    assert namespace.version('version') != version
+
+
+def test_uncacheable_value_is_not_stored(namespace):
+    """Тест значение, отвергнутое cacheable, считается каждый раз."""
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return VALUE
+
+    for _ in range(2):
+        assert namespace.get_or_set(
+            'key', compute, 60, cacheable=lambda value: False
+        ) == VALUE
+    assert len(calls) == 2
+
+
+@pytest.mark.django_db
+def test_bump_repeats_after_commit(django_capture_on_commit_callbacks):
+    """Тест версия сбрасывается ещё раз после коммита транзакции."""
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        BannedWord.objects.create(word='Бармалей')
+        version = banned_words_version()
+    assert callbacks
+    assert banned_words_version() != version
+
+
+def test_get_or_set_computes_once(namespace):
+    """Тест значение считается при промахе и дальше берётся из кеша."""
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return VALUE
+
+    assert namespace.get_or_set('key', compute, 60) == VALUE
+    assert namespace.get_or_set('key', compute, 60) == VALUE
+    assert calls == [1]
+
+
+def test_early_recompute_by_lock_holder_only(namespace):
+    """Тест устаревающую запись пересчитывает только взявший блокировку."""
+    namespace.early = 1
+    namespace.get_or_set('key', lambda: 'старое', 60)
+    assert namespace._lock('key')
+    assert namespace.get_or_set('key', lambda: VALUE, 60) == 'старое'
+    cache.delete('test:key:lock')
+    assert namespace.get_or_set('key', lambda: VALUE, 60) == VALUE
+    assert namespace.stats['early_recomputes'] == 1
+
+
+def test_concurrent_miss_waits_for_lock_holder(namespace):
+    """Тест при одновременном промахе значение считается один раз."""
+    calls = []
+
+    def compute():
+        time.sleep(0.2)
+        calls.append(1)
+        return VALUE
+
+    holder = threading.Thread(
+        target=namespace.get_or_set, args=('key', compute, 60)
+    )
+    holder.start()
+    time.sleep(0.05)
+    assert namespace.get_or_set('key', compute, 60) == VALUE
+    holder.join()
+    assert calls == [1]
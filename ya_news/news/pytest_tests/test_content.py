@@ -1,7 +1,14 @@
 """Тестирование контента."""
+from http import HTTPStatus
+
+import pytest
 from django.conf import settings
+from django.db import connection
 from django.urls import reverse
 
+from news.fts import INTEGRITY_CHECK
+from news.views import NewsList
+
 FORM = 'form'
 
 
@@ -46,3 +53,124 @@ def test_authorized_client_has_form(author_client, detail_url):
     """Тест у автора в контексте есть форма."""
     response = author_client.get(detail_url)
     assert FORM in response.context
+
+
+def test_news_next_page(client, news_for_sort):
+    """Тест по курсору открывается страница с более ранними новостями."""
+    url = reverse('news:home')
+    first_page = client.get(url).context['page']
+    assert first_page.has_next
+    response = client.get(url, {'cursor': first_page.next_cursor})
+    object_list = response.context['object_list']
+    assert len(object_list) == 1
+    assert object_list[0].date < first_page.object_list[-1].date
+    assert not response.context['page'].has_next
+
+
+def test_comments_next_page(client, settings, comment_for_sort, detail_url):
+    """Тест комментарии к новости выводятся постранично."""
+    settings.COMMENTS_COUNT_ON_DETAIL_PAGE = 1
+    response = client.get(detail_url)
+    first_page = response.context['comments']
+    assert 'Tекст 0' in first_page.html
+    assert 'Tекст 1' not in first_page.html
+    response = client.get(detail_url, {'cursor': first_page.next_cursor})
+    second_page = response.context['comments']
+    assert 'Tекст 1' in second_page.html
+    assert not second_page.has_next
+
+
+def test_cached_comments_follow_changes(author_client, comment, detail_url):
+    """Тест закешированные комментарии обновляются после правки."""
+    assert comment.text in author_client.get(detail_url).content.decode()
+    comment.text = 'Исправленный текст'
+    comment.save()
+    content = author_client.get(detail_url).content.decode()
+    assert 'Исправленный текст' in content
+
+
+def test_comment_links_only_for_author(admin_client,
+                                       author_client,
+                                       comment,
+                                       detail_url):
+    """Тест ссылки на правку видны только автору, хотя фрагмент общий."""
+    edit_url = reverse('news:edit', args=(comment.id,))
+    assert edit_url in author_client.get(detail_url).content.decode()
+    assert edit_url not in admin_client.get(detail_url).content.decode()
+
+
+def test_invalid_cursor(client, news):
+    """Тест некорректный курсор приводит к ошибке 404."""
+    response = client.get(reverse('news:home'), {'cursor': 'не-курсор'})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_home_not_modified(client, news):
+    """Тест повторный запрос ленты с тем же ETag получает ответ 304."""
+    url = reverse('news:home')
+    response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    response = client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_home_etag_changes_after_write(client, news):
+    """Тест после изменения новости лента получает новый ETag."""
+    url = reverse('news:home')
+    etag = client.get(url)['ETag']
+    news.title = 'Новый заголовок'
+    news.save()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert 'Новый заголовок' in response.content.decode()
+
+
+def test_home_served_from_cache(client, news, django_assert_num_queries):
+    """Тест повторная лента для анонима отдаётся без запросов к БД."""
+    url = reverse('news:home')
+    client.get(url)
+    with django_assert_num_queries(0):
+        response = client.get(url)
+    assert news.title in response.content.decode()
+
+
+def test_home_with_cookies_not_cached(client, news, monkeypatch):
+    """Тест ответ ленты с cookies не попадает в кеш для анонимов."""
+    render_to_response = NewsList.render_to_response
+
+    def with_cookie(self, *args, **kwargs):
+        response = render_to_response(self, *args, **kwargs)
+        response.set_cookie('visitor', 'private')
+        return response
+
+    monkeypatch.setattr(NewsList, 'render_to_response', with_cookie)
+    url = reverse('news:home')
+    client.get(url)
+    response = client.get(url)
+    assert response.context is not None
+    assert response.cookies['visitor'].value == 'private'
+
+
+@pytest.mark.parametrize('query', ('заголов', 'комментар'))
+def test_search_by_news_and_comments(client, comment, news, query):
+    """Тест новость находится по своему тексту и по комментариям."""
+    response = client.get(reverse('news:search'), {'q': query})
+    assert list(response.context['object_list']) == [news]
+
+
+def test_search_follows_deleted_comment(client, comment):
+    """Тест удалённый комментарий больше не находится поиском."""
+    comment.delete()
+    response = client.get(reverse('news:search'), {'q': 'комментар'})
+    assert list(response.context['object_list']) == []
+
+
+def test_search_index_intact_after_edit(comment, news):
+    """Тест после правки новости и комментария индекс цел."""
+    news.title = 'Новый заголовок'
+    news.save()
+    comment.text = 'Новый текст'
+    comment.save()
+    with connection.cursor() as cursor:
+        for statement in INTEGRITY_CHECK:
+            cursor.execute(statement)
@@ -1,13 +1,38 @@
 """Тестирование логики."""
 from http import HTTPStatus
+from io import StringIO
 from random import choice
 
 import pytest
+from django.core.management import call_command
+from django.urls import reverse
 from pytest_django.asserts import assertFormError, assertRedirects
 
 from conftest import COMMENT_TEXT
-from news.forms import BAD_WORDS, WARNING
-from news.models import Comment
+from news.forms import BAD_WORDS, WARNING, CommentForm
+from news.models import BannedWord, Comment, News
+from news.profanity import BadWordsMatcher
+
+
+@pytest.mark.django_db
+def test_user_cant_hide_bad_words_with_latin_letters(author_client,
+                                                     detail_url):
+    """Тест латинские буквы-двойники не помогают обойти фильтр."""
+    response = author_client.post(detail_url, data={'text': 'Ты рeдиcкa!'})
+    assertFormError(response, 'form', 'text', errors=WARNING)
+    assert Comment.objects.count() == 0
+
+
+@pytest.mark.parametrize('text, whole_words, expected',
+                         (('ах ты редиска', False, 'редиска'),
+                          ('редиски', False, None),
+                          ('ах ты редиска', True, 'редиска'),
+                          ('нередиска', True, None),
+                          ('негодяйка', False, 'негодяй'), ), )
+def test_bad_words_matcher(text, whole_words, expected):
+    """Тест автомат находит запрещённые слова в тексте."""
+    matcher = BadWordsMatcher(BAD_WORDS, whole_words=whole_words)
+    assert matcher.search(text) == expected
 
 
 @pytest.mark.django_db
@@ -96,3 +121,70 @@ def test_user_cant_delete_comment_of_another_user(admin_client,
     assert response.status_code == HTTPStatus.NOT_FOUND
     comments_count = Comment.objects.count()
     assert comments_count == comment_count_before_delete
+
+
+def test_comment_count_follows_create_and_delete(author_client,
+                                                 news,
+                                                 form_data,
+                                                 detail_url):
+    """Тест счётчик комментариев растёт и уменьшается вместе с ними."""
+    author_client.post(detail_url, data=form_data)
+    news.refresh_from_db()
+    assert news.comment_count == 1
+    comment = Comment.objects.get()
+    author_client.delete(reverse('news:delete', args=(comment.id,)))
+    news.refresh_from_db()
+    assert news.comment_count == 0
+
+
+def test_comment_count_follows_bulk_operations(author, news):
+    """Тест счётчик комментариев актуален после массовых операций."""
+    Comment.objects.bulk_create(
+        Comment(news=news, author=author, text=f'Текст {index}')
+        for index in range(3)
+    )
+    news.refresh_from_db()
+    assert news.comment_count == 3
+    Comment.objects.filter(pk__in=Comment.objects.values('pk')[:2]).delete()
+    news.refresh_from_db()
+    assert news.comment_count == 1
+
+
+def test_comment_count_follows_user_delete(author, news, django_user_model):
+    """Тест счётчик уменьшается, когда удаляют автора комментариев."""
+    reader = django_user_model.objects.create(username='Читатель')
+    Comment.objects.create(news=news, author=author, text=COMMENT_TEXT)
+    Comment.objects.create(news=news, author=reader, text=COMMENT_TEXT)
+    author.delete()
+    news.refresh_from_db()
+    assert news.comment_count == 1
+    django_user_model.objects.all().delete()
+    news.refresh_from_db()
+    assert news.comment_count == 0
+
+
+def test_recount_comments_command(comment, news):
+    """Тест команда recount_comments восстанавливает счётчик."""
+    News.objects.update(comment_count=0)
+    call_command('recount_comments', stdout=StringIO())
+    news.refresh_from_db()
+    assert news.comment_count == 1
+
+
+def test_banned_word_from_admin_applies_at_once(author_client, detail_url):
+    """Тест слово, добавленное в базу, сразу запрещается в комментариях."""
+    data = {'text': 'Ну ты и бармалей'}
+    author_client.post(detail_url, data=data)
+    assert Comment.objects.count() == 1
+    BannedWord.objects.create(word='Бармалей')
+    response = author_client.post(detail_url, data=data)
+    assertFormError(response, 'form', 'text', errors=WARNING)
+    assert Comment.objects.count() == 1
+
+
+def test_bad_words_checked_without_queries(news, author,
+                                           django_assert_num_queries):
+    """Тест скомпилированный словарь не запрашивается для каждого текста."""
+    CommentForm(data={'text': 'Текст'}).is_valid()
+    with django_assert_num_queries(0):
+        assert not CommentForm(data={'text': 'Ах ты редиска'}).is_valid()
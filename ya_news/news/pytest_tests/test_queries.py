@@ -0,0 +1,161 @@
+"""Тестирование количества запросов к БД."""
+import pytest
+from django.urls import reverse
+from pytest_django.asserts import assertRedirects
+
+from news.models import Comment
+from yacommon.auth import user_cache
+from yacommon.middleware import QueryBudgetExceeded
+
+# Сессия и пользователь авторизованного клиента берутся из кешей,
+# без них было бы 2 запроса.
+AUTH_QUERIES = 0
+
+
+@pytest.mark.parametrize('name, queries',
+                         (('news:home', 1),
+                          ('users:login', 0),
+                          ('users:signup', 0), ), )
+def test_anonymous_pages_queries(client, news, name, queries,
+                                 django_assert_num_queries):
+    """Тест число запросов на страницах для анонимного пользователя."""
+    with django_assert_num_queries(queries):
+        client.get(reverse(name))
+
+
+def test_home_queries_for_auth_user(author_client, news,
+                                    django_assert_num_queries):
+    """Тест лента авторизованного пользователя строится одним запросом."""
+    with django_assert_num_queries(AUTH_QUERIES + 1):
+        author_client.get(reverse('news:home'))
+
+
+def test_detail_queries(client, comment, detail_url,
+                        django_assert_num_queries):
+    """
+    Тест страница новости: новость и одна страница комментариев
+    вместе с авторами.
+    """
+    with django_assert_num_queries(2):
+        client.get(detail_url)
+
+
+def test_detail_queries_do_not_grow_with_comments(client, author, news,
+                                                  detail_url,
+                                                  django_assert_num_queries):
+    """Тест число запросов не зависит от количества комментариев."""
+    Comment.objects.bulk_create(
+        Comment(news=news, author=author, text=f'Текст {index}')
+        for index in range(20)
+    )
+    with django_assert_num_queries(2):
+        client.get(detail_url)
+
+
+def test_comment_post_queries(author_client, news, form_data, detail_url,
+                              django_assert_num_queries):
+    """Тест отправка комментария загружает новость один раз."""
+    with django_assert_num_queries(AUTH_QUERIES + 4):
+        response = author_client.post(detail_url, data=form_data)
+    assertRedirects(response, f'{detail_url}#comments',
+                    fetch_redirect_response=False)
+
+
+@pytest.mark.parametrize('name, queries',
+                         (('news:edit', 1),
+                          ('news:delete', 1), ), )
+def test_comment_pages_queries(author_client, comment, name, queries,
+                               django_assert_num_queries):
+    """Тест страницы правки и удаления загружают комментарий с новостью."""
+    with django_assert_num_queries(AUTH_QUERIES + queries):
+        author_client.get(reverse(name, args=(comment.id,)))
+
+
+def test_comment_edit_queries(author_client, comment, edit_url, form_data,
+                              django_assert_num_queries):
+    """Тест правка комментария не перечитывает его для редиректа."""
+    with django_assert_num_queries(AUTH_QUERIES + 3):
+        author_client.post(edit_url, data=form_data)
+
+
+def test_comment_delete_queries(author_client, comment, delete_url,
+                                django_assert_num_queries):
+    """Тест удаление комментария не перечитывает его для редиректа."""
+    with django_assert_num_queries(AUTH_QUERIES + 3):
+        author_client.delete(delete_url)
+
+
+def test_server_timing_header(client, news):
+    """Тест ответ содержит заголовок Server-Timing с числом запросов."""
+    response = client.get(reverse('news:home'))
+    assert 'queries' in response['Server-Timing']
+    assert 'total;dur=' in response['Server-Timing']
+
+
+def test_query_budget_exceeded(client, settings, news, detail_url):
+    """Тест превышение бюджета запросов приводит к ошибке."""
+    settings.QUERY_BUDGETS = {'news:detail': 1}
+    with pytest.raises(QueryBudgetExceeded):
+        client.get(detail_url)
+
+
+def test_request_stats_for_staff(admin_client, news):
+    """Тест статистика запросов доступна персоналу."""
+    admin_client.get(reverse('news:home'))
+    stats = admin_client.get(reverse('request_stats')).json()
+    assert stats['news:home']['requests'] >= 1
+
+
+def test_user_loaded_once_per_timeout(author_client, news,
+                                      django_assert_num_queries):
+    """Тест пользователь читается из БД один раз, дальше — из кеша."""
+    user_cache.clear()
+    url = reverse('news:home')
+    with django_assert_num_queries(1 + 1):
+        author_client.get(url)
+    with django_assert_num_queries(1):
+        author_client.get(url)
+
+
+def test_user_cache_follows_user_changes(author_client, author, news):
+    """Тест изменение пользователя сразу видно в следующем запросе."""
+    author_client.get(reverse('news:home'))
+    author.username = 'Новое имя'
+    author.save()
+    response = author_client.get(reverse('news:home'))
+    assert response.context['user'].username == 'Новое имя'
+    author.is_active = False
+    author.save()
+    response = author_client.get(reverse('news:home'))
+    assert not response.context['user'].is_authenticated
+
+
+def test_user_cache_expires(settings, author_client, news,
+                            django_assert_num_queries):
+    """Тест по истечении таймаута пользователь читается из БД заново."""
+    settings.USER_CACHE_TIMEOUT = 0
+    user_cache.clear()
+    author_client.get(reverse('news:home'))
+    with django_assert_num_queries(AUTH_QUERIES + 2):
+        author_client.get(reverse('news:home'))
+
+
+@pytest.mark.django_db
+def test_user_cache_is_bounded(settings, django_user_model):
+    """Тест кеш вытесняет давно не читавшихся и забывает просроченных."""
+    settings.USER_CACHE_MAX_ENTRIES = 2
+    first, second, third = (
+        django_user_model.objects.create(username=f'Читатель {index}')
+        for index in range(3)
+    )
+    user_cache.set(first)
+    user_cache.set(second)
+    assert user_cache.get(first.pk) is not None
+    user_cache.set(third)
+    assert len(user_cache) == 2
+    assert user_cache.get(second.pk) is None
+    assert user_cache.get(first.pk) is not None
+    settings.USER_CACHE_TIMEOUT = -1
+    user_cache.set(second)
+    assert user_cache.get(second.pk) is None
+    assert len(user_cache) == 1
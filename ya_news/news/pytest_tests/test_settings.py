@@ -0,0 +1,41 @@
+"""Тестирование продакшен-профиля настроек."""
+import importlib
+import sys
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+from yanews.settings import prod
+
+
+def test_prod_profile():
+    """Тест без отладки, с общим кешем и постоянными соединениями."""
+    assert not prod.DEBUG
+    assert prod.CACHES['default']['BACKEND'].endswith('FileBasedCache')
+    database = prod.DATABASES['default']
+    assert database['POOL_SIZE'] or database['CONN_MAX_AGE'] > 0
+
+
+def test_prod_requires_secret_key(monkeypatch):
+    """Тест без DJANGO_SECRET_KEY продакшен-профиль не загружается."""
+    monkeypatch.delenv('DJANGO_SECRET_KEY')
+    monkeypatch.delitem(sys.modules, prod.__name__)
+    with pytest.raises(ImproperlyConfigured):
+        importlib.import_module(prod.__name__)
+
+
+def test_prod_responses_are_gzipped(client, settings, news_for_sort):
+    """Тест в продакшен-профиле страницы сжимаются gzip."""
+    settings.MIDDLEWARE = prod.MIDDLEWARE
+    response = client.get(reverse('news:home'), HTTP_ACCEPT_ENCODING='gzip')
+    assert response['Content-Encoding'] == 'gzip'
+    assert 'total;dur=' in response['Server-Timing']
+
+
+def test_prod_query_budget_middleware_first():
+    """Тест замер запроса охватывает все middleware, включая сжатие."""
+    assert prod.MIDDLEWARE[:2] == [
+        'yacommon.middleware.QueryBudgetMiddleware',
+        'django.middleware.gzip.GZipMiddleware',
+    ]
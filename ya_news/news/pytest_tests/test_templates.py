@@ -0,0 +1,26 @@
+"""Тестирование прогрева кеша шаблонов."""
+from django.template import engines
+
+from yacommon.templates import warm_templates
+from yanews.settings import prod
+
+
+def test_prod_templates_are_warmed(settings):
+    """Тест в продакшен-профиле все шаблоны попадают в кеш загрузчика."""
+    settings.TEMPLATES = prod.TEMPLATES
+    assert warm_templates() > 0
+    loader, = engines['django'].engine.template_loaders
+    assert 'news/home.html' in loader.get_template_cache
+    assert 'includes/header.html' in loader.get_template_cache
+
+
+def test_dev_templates_are_not_warmed(settings):
+    """Тест без кеширующего загрузчика прогревать нечего."""
+    template_settings, = prod.TEMPLATES
+    settings.TEMPLATES = [{**template_settings, 'OPTIONS': {
+        **template_settings['OPTIONS'], 'loaders': [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]
+    }}]
+    assert warm_templates() == 0
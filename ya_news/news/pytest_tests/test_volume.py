@@ -0,0 +1,60 @@
+"""Тестирование страниц на объёмных данных."""
+import pytest
+from django.conf import settings
+from django.urls import reverse
+
+from news.models import Comment, News
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures('news_volume')]
+
+
+def test_home_pages_cover_all_news(client, django_assert_max_num_queries):
+    """
+    Тест по курсорам лента проходится целиком без пропусков,
+    число запросов на страницу не растёт.
+    """
+    url = reverse('news:home')
+    seen = []
+    cursor = None
+    while True:
+        with django_assert_max_num_queries(3):
+            response = client.get(url, {'cursor': cursor} if cursor else {})
+        page = response.context['page']
+        seen += [news.pk for news in page]
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+    assert seen == list(
+        News.objects.order_by('-date', '-id').values_list('pk', flat=True)
+    )
+
+
+def test_hot_thread_comment_count(news_volume):
+    """Тест счётчик комментариев сходится с их числом."""
+    hot = News.objects.get(pk=news_volume[0].pk)
+    assert hot.comment_count == Comment.objects.filter(news=hot).count()
+
+
+def test_hot_thread_detail_queries(client, news_volume,
+                                   django_assert_num_queries):
+    """Тест страница новости с тысячами комментариев — два запроса."""
+    url = reverse('news:detail', args=(news_volume[0].pk,))
+    with django_assert_num_queries(2):
+        response = client.get(url)
+    assert response.context['comments'].has_next
+
+
+def test_hot_thread_api_walk(client, news_volume):
+    """Тест API отдаёт все комментарии по порядку страницами."""
+    hot = news_volume[0]
+    url = reverse('news:api_comments', kwargs={'pk': hot.pk})
+    ids = []
+    pages = 0
+    while url:
+        data = client.get(url).json()
+        ids += [row['id'] for row in data['results']]
+        url = data['next']
+        pages += 1
+    assert ids == list(Comment.objects.filter(news=hot).order_by(
+        'created', 'id').values_list('pk', flat=True))
+    assert pages == -(-len(ids) // settings.COMMENTS_COUNT_ON_DETAIL_PAGE)
@@ -0,0 +1,70 @@
+"""
+Полнотекстовый поиск по новостям и комментариям.
+
+На SQLite индексы — виртуальные таблицы FTS5 news_news_fts и
+news_comment_fts, которые триггеры синхронизируют при любой записи,
+включая массовые операции. SQLite пересоздаёт таблицу при некоторых
+изменениях схемы и теряет триггеры, поэтому после таких миграций
+нужно выполнить команду rebuild_search_index. На других СУБД
+используется медленный поиск через icontains.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .fts import REBUILD, SCHEMA
+from .models import News
+
+TOKENS = re.compile(r'\w+')
+
+# Новость попадает в выдачу по своему тексту или по комментариям,
+# место определяет лучшее из совпадений.
+SEARCH_SQL = (
+    'SELECT news_news.id, news_news.title, news_news.text, '
+    'news_news.date, news_news.comment_count '
+    'FROM news_news JOIN ('
+    'SELECT news_id, min(rank) AS rank FROM ('
+    'SELECT rowid AS news_id, rank FROM news_news_fts '
+    'WHERE news_news_fts MATCH %s '
+    'UNION ALL '
+    'SELECT news_comment.news_id, news_comment_fts.rank '
+    'FROM news_comment_fts '
+    'JOIN news_comment ON news_comment.id = news_comment_fts.rowid '
+    'WHERE news_comment_fts MATCH %s'
+    ') GROUP BY news_id'
+    ') AS found ON found.news_id = news_news.id '
+    'ORDER BY found.rank, news_news.id '
+    'LIMIT %s OFFSET %s'
+)
+
+
+def match_expression(query):
+    """Все слова запроса как префиксы: «кот дом» → "кот"* "дом"*."""
+    return ' '.join(f'"{token}"*' for token in TOKENS.findall(query))
+
+
+def search_news(query, limit, offset=0):
+    """Новости, подходящие под запрос, от лучших к худшим."""
+    expression = match_expression(query)
+    if not expression:
+        return []
+    if connection.vendor != 'sqlite':
+        return list(News.objects.filter(
+            Q(title__icontains=query)
+            | Q(text__icontains=query)
+            | Q(comment__text__icontains=query)
+        ).distinct()[offset:offset + limit])
+    return list(News.objects.raw(
+        SEARCH_SQL, [expression, expression, limit, offset]
+    ))
+
+
+def rebuild_search_index():
+    """Создаём недостающие таблицы и триггеры и переиндексируем данные."""
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        for statement in (*SCHEMA, *REBUILD):
+            cursor.execute(statement)
+    return True
@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import (
+    bump_banned_words_version, bump_comments_version, bump_home_version
+)
+from .models import BannedWord, Comment, News
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comments(sender, instance, **kwargs):
+    """Создание, правка и удаление комментария сбрасывают кеш новости."""
+    bump_comments_version(instance.news_id)
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+def invalidate_home(sender, **kwargs):
+    """Изменение новости сбрасывает кеш ленты."""
+    bump_home_version()
+
+
+@receiver(post_save, sender=BannedWord)
+@receiver(post_delete, sender=BannedWord)
+def invalidate_banned_words(sender, **kwargs):
+    """Изменение словаря в админке сбрасывает скомпилированные автоматы."""
+    bump_banned_words_version()
+
+
+@receiver(pre_delete, sender=User)
+def remember_commented_news(sender, instance, **kwargs):
+    """Запоминаем новости, которые потеряют комментарии пользователя."""
+    instance._commented_news_ids = set(
+        Comment.objects.filter(author=instance).values_list(
+            'news_id', flat=True
+        )
+    )
+
+
+@receiver(post_delete, sender=User)
+def refresh_commented_news(sender, instance, **kwargs):
+    """
+    Каскад удаляет комментарии мимо Comment.delete и CommentQuerySet.
+
+    Поэтому счётчик затронутых новостей пересчитываем здесь.
+    """
+    news_ids = getattr(instance, '_commented_news_ids', None)
+    if news_ids:
+        News.objects.refresh_comment_count(news_ids)
@@ -1,39 +1,168 @@
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils.decorators import method_decorator
 from django.views import generic
+from django.views.decorators.http import condition
 
+from .cache import (
+    CommentsFragment, comments_fragment_key, home_last_modified, home_page_key,
+    home_version, news_cache
+)
 from .forms import CommentForm
 from .models import Comment, News
+from .pagination import KeysetPaginator
+from .search import search_news
 
+CURSOR = 'cursor'
 
+
+def home_page(cursor):
+    """Страница ленты новостей после курсора."""
+    paginator = KeysetPaginator(
+        News.objects.only('title', 'text', 'date', 'comment_count'),
+        ('-date', '-id'),
+        settings.NEWS_COUNT_ON_HOME_PAGE
+    )
+    return paginator.page(cursor)
+
+
+def comments_fragment(news, cursor):
+    """Отрендеренная страница комментариев к новости, общая для всех."""
+
+    def render_fragment():
+        paginator = KeysetPaginator(
+            news.comment_set.select_related('author'),
+            ('created', 'id'),
+            settings.COMMENTS_COUNT_ON_DETAIL_PAGE
+        )
+        page = paginator.page(cursor)
+        return CommentsFragment(
+            render_to_string(
+                'news/includes/comments.html', {'comment_page': page}
+            ),
+            page.next_cursor
+        )
+
+    return news_cache.get_or_set(
+        comments_fragment_key(news.pk, cursor),
+        render_fragment,
+        settings.NEWS_FRAGMENT_CACHE_TIMEOUT
+    )
+
+
+def home_etag(request, *args, **kwargs):
+    """В шапке страницы есть имя пользователя, поэтому ETag у каждого свой."""
+    return f'{home_version()}-{request.user.pk or 0}'
+
+
+def home_modified(request, *args, **kwargs):
+    return home_last_modified()
+
+
+def without_cookies(response):
+    """Ответ с cookies личный: его нельзя отдавать другим анонимам."""
+    return not response.cookies
+
+
+@method_decorator(
+    condition(etag_func=home_etag, last_modified_func=home_modified),
+    name='dispatch'
+)
 class NewsList(generic.ListView):
     """Список новостей."""
     model = News
     template_name = 'news/home.html'
 
+    def get(self, request, *args, **kwargs):
+        """
+        Анонимным читателям отдаём готовую страницу из кеша.
+
+        Ключ содержит версию ленты, которая меняется при любой записи
+        новостей или комментариев. После сброса страницу рендерит
+        один из процессов, делящих кеш, остальные дожидаются её.
+        Ответы с cookies не кешируются.
+        """
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+        return news_cache.get_or_set(
+            home_page_key(request.GET.get(CURSOR)),
+            lambda: super(NewsList, self).get(
+                request, *args, **kwargs
+            ).render(),
+            settings.NEWS_FRAGMENT_CACHE_TIMEOUT,
+            cacheable=without_cookies
+        )
+
     def get_queryset(self):
         """
-        Выводим только несколько последних новостей.
+        Выводим страницу новостей после курсора из запроса.
 
-        Их количество определяется в настройках проекта.
+        Размер страницы определяется в настройках проекта.
         """
-        return self.model.objects.prefetch_related(
-            'comment_set'
-        )[:settings.NEWS_COUNT_ON_HOME_PAGE]
+        self.page = home_page(self.request.GET.get(CURSOR))
+        return self.page.object_list
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['page'] = self.page
+        return context
 
-class NewsDetail(generic.DetailView):
-    model = News
-    template_name = 'news/detail.html'
 
-    def get_object(self, queryset=None):
-        obj = get_object_or_404(
-            self.model.objects.prefetch_related('comment_set__author'),
-            pk=self.kwargs['pk']
+class NewsSearch(generic.ListView):
+    """Полнотекстовый поиск по новостям и комментариям к ним."""
+    template_name = 'news/search.html'
+
+    def get_queryset(self):
+        """Страница найденных новостей, лучшие совпадения первыми."""
+        per_page = settings.SEARCH_RESULTS_ON_PAGE
+        try:
+            self.page = max(int(self.request.GET.get('page', 1)), 1)
+        except ValueError:
+            raise Http404('Некорректный номер страницы.')
+        news = search_news(
+            self.request.GET.get('q', ''),
+            per_page + 1,
+            (self.page - 1) * per_page
         )
-        return obj
+        self.has_next = len(news) > per_page
+        return news[:per_page]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(
+            query=self.request.GET.get('q', ''),
+            page=self.page,
+            has_next=self.has_next,
+        )
+        return context
+
+
+class CommentsPageMixin:
+    """Добавляет в контекст страницу комментариев к новости."""
+
+    def get_comments(self):
+        """
+        Берём отрендеренную страницу комментариев из кеша.
+
+        Фрагмент общий для всех читателей, ссылки на действия
+        с комментариями подставляются для текущего пользователя.
+        """
+        return comments_fragment(
+            self.object, self.request.GET.get(CURSOR)
+        ).for_user(self.request.user)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['comments'] = self.get_comments()
+        return context
+
+
+class NewsDetail(CommentsPageMixin, generic.DetailView):
+    model = News
+    template_name = 'news/detail.html'
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -44,6 +173,7 @@ class NewsDetail(generic.DetailView):
 
 class NewsComment(
         LoginRequiredMixin,
+        CommentsPageMixin,
         generic.detail.SingleObjectMixin,
         generic.FormView
 ):
@@ -63,8 +193,9 @@ class NewsComment(
         return super().form_valid(form)
 
     def get_success_url(self):
-        post = self.get_object()
-        return reverse('news:detail', kwargs={'pk': post.pk}) + '#comments'
+        return reverse(
+            'news:detail', kwargs={'pk': self.object.pk}
+        ) + '#comments'
 
 
 class NewsDetailView(generic.View):
@@ -83,14 +214,16 @@ class CommentBase(LoginRequiredMixin):
     model = Comment
 
     def get_success_url(self):
-        comment = self.get_object()
+        """Комментарий уже загружен представлением, новость не нужна."""
         return reverse(
-            'news:detail', kwargs={'pk': comment.news.pk}
+            'news:detail', kwargs={'pk': self.object.news_id}
         ) + '#comments'
 
     def get_queryset(self):
         """Пользователь может работать только со своими комментариями."""
-        return self.model.objects.filter(author=self.request.user)
+        return self.model.objects.select_related('news').filter(
+            author=self.request.user
+        )
 
 
 class CommentUpdate(CommentBase, generic.UpdateView):
@@ -9,8 +9,31 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
+
+from yacommon.templates import warm_templates
+
+ASYNC_URLCONF = 'yanews.asgi_urls'
+
+
+class AsyncPagesHandler(ASGIHandler):
+    """
+    ASGI-обработчик, который ведёт запросы в yanews.asgi_urls.
+
+    URLconf задаётся на запросе, а не в настройках, поэтому команды
+    и WSGI-развёртывание с теми же настройками его не наследуют.
+    """
+
+    async def get_response_async(self, request):
+        request.urlconf = ASYNC_URLCONF
+        return await super().get_response_async(request)
+
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'yanews.settings')
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+application = AsyncPagesHandler()
+
+# С кеширующим загрузчиком шаблоны разбираются до первого запроса.
+warm_templates()
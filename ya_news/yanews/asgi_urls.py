@@ -0,0 +1,9 @@
+"""Корневые маршруты для yanews.asgi: news с асинхронными страницами."""
+from django.urls import include, path
+
+from . import urls
+
+urlpatterns = [path('', include('news.async_urls'))] + [
+    pattern for pattern in urls.urlpatterns
+    if getattr(pattern, 'app_name', None) != 'news'
+]
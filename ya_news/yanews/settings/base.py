@@ -0,0 +1,129 @@
+"""
+Общие настройки проекта для всех окружений.
+
+Профили dev и prod переопределяют отладку, шаблоны, кеш и middleware.
+"""
+from pathlib import Path
+
+from django.urls import reverse_lazy
+
+from yacommon.db import database_config
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+SECRET_KEY = 'django-insecure-7)dgs++2!#==aye4rd=5)c)bw0eokiyqx0hts6#t80!$c&$s+('
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['localhost', '127.0.0.1']
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'news.apps.NewsConfig',
+]
+
+MIDDLEWARE = [
+    'yacommon.middleware.QueryBudgetMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+# yanews.asgi направляет свои запросы в yanews.asgi_urls
+# с асинхронными страницами чтения.
+ROOT_URLCONF = 'yanews.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates'],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'yanews.wsgi.application'
+
+
+DATABASES = {
+    'default': database_config(BASE_DIR / 'db.sqlite3'),
+}
+
+
+# Слой yacommon.cache добавляет к ключам пространство приложения,
+# KEY_PREFIX разделяет проекты, если они делят один кеш.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'KEY_PREFIX': 'yanews',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+}
+
+
+AUTH_PASSWORD_VALIDATORS = []
+
+
+LANGUAGE_CODE = 'ru'
+
+TIME_ZONE = 'Europe/Moscow'
+
+USE_I18N = True
+
+USE_L10N = True
+
+USE_TZ = True
+
+STATIC_URL = '/static/'
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Сессии читаются из кеша и записываются в кеш и БД.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+AUTHENTICATION_BACKENDS = ['yacommon.auth.CachedModelBackend']
+
+# Сколько секунд пользователь сессии живёт в кеше процесса
+# и сколько пользователей кеш держит, вытесняя давно не нужных.
+USER_CACHE_TIMEOUT = 30
+USER_CACHE_MAX_ENTRIES = 1000
+
+LOGIN_URL = reverse_lazy('users:login')
+LOGIN_REDIRECT_URL = reverse_lazy('news:home')
+
+NEWS_COUNT_ON_HOME_PAGE = 10
+
+COMMENTS_COUNT_ON_DETAIL_PAGE = 50
+
+SEARCH_RESULTS_ON_PAGE = 20
+
+NEWS_FRAGMENT_CACHE_TIMEOUT = 60 * 60
+
+# Максимальное число SQL-запросов на один HTTP-запрос по имени маршрута.
+QUERY_BUDGETS = {
+    'news:home': 3,
+    'news:detail': 7,
+    'news:edit': 5,
+    'news:delete': 5,
+    'news:api_news': 3,
+    'news:api_comments': 4,
+}
+
+# 'log' — предупреждение в лог, 'raise' — исключение QueryBudgetExceeded.
+QUERY_BUDGET_ACTION = 'log'
@@ -0,0 +1,83 @@
+"""
+Продакшен-профиль.
+
+Переменные окружения, кроме описанных в yacommon.db:
+DJANGO_SECRET_KEY     секретный ключ, обязателен;
+DJANGO_ALLOWED_HOSTS  разрешённые хосты через запятую;
+DJANGO_CACHE_DIR      каталог файлового кеша, общего для воркеров.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import ALLOWED_HOSTS, CACHES, DATABASES, MIDDLEWARE, TEMPLATES
+
+# Без отладки Django не копит выполненные SQL в connection.queries.
+DEBUG = False
+
+# Ключ из base.py лежит в репозитории и в продакшене не годится.
+try:
+    SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+except KeyError:
+    raise ImproperlyConfigured(
+        'Задайте секретный ключ в переменной DJANGO_SECRET_KEY.'
+    ) from None
+
+ALLOWED_HOSTS = os.environ.get(
+    'DJANGO_ALLOWED_HOSTS', ','.join(ALLOWED_HOSTS)
+).split(',')
+
+# Каждый шаблон разбирается один раз на процесс,
+# wsgi.py и asgi.py прогревают их при старте.
+TEMPLATES = [{
+    **TEMPLATES[0],
+    'APP_DIRS': False,
+    'OPTIONS': {
+        **TEMPLATES[0]['OPTIONS'],
+        'debug': False,
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+        ],
+    },
+}]
+
+# Без пула соединение с БД живёт между запросами 10 минут.
+DATABASES = {
+    'default': {
+        **DATABASES['default'],
+        'CONN_MAX_AGE': (
+            0 if DATABASES['default']['POOL_SIZE']
+            else int(os.environ.get('DB_CONN_MAX_AGE', 600))
+        ),
+    },
+}
+
+# Файловый кеш общий для всех воркеров на машине, поэтому версии
+# и сброс закешированных страниц видят все процессы. add() и incr()
+# у FileBasedCache не атомарны между процессами: блокировка от
+# одновременного пересчёта и сброс версий работают по возможности,
+# изредка страницу пересчитают два воркера или один сброс потеряется
+# (его повторит следующий). Для нескольких машин или строгих гарантий
+# нужен бэкенд с атомарными add/incr, например Memcached.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get(
+            'DJANGO_CACHE_DIR', Path(tempfile.gettempdir()) / 'yanews-cache'
+        ),
+        'KEY_PREFIX': CACHES['default']['KEY_PREFIX'],
+        'OPTIONS': CACHES['default']['OPTIONS'],
+    },
+}
+
+# Сжатие стоит снаружи всех middleware, которые читают тело ответа,
+# но внутри QueryBudgetMiddleware, чтобы total учитывал и его.
+MIDDLEWARE = [
+    MIDDLEWARE[0], 'django.middleware.gzip.GZipMiddleware', *MIDDLEWARE[1:]
+]
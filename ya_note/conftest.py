@@ -0,0 +1,21 @@
+import os
+
+import pytest
+from django.core.cache import cache
+
+from yacommon.auth import user_cache
+
+# Тесты импортируют продакшен-профиль, которому нужен ключ из окружения.
+os.environ.setdefault('DJANGO_SECRET_KEY', 'test-secret-key')
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Очищаем кеши перед каждым тестом.
+
+    Откат транзакции TestCase не сбрасывает версии кеша заметок,
+    и без очистки тест увидел бы страницы, закешированные другим.
+    """
+    cache.clear()
+    user_cache.clear()
@@ -0,0 +1,35 @@
+"""Кеш заметок автора: страницы списка и отдельные заметки."""
+from django.conf import settings
+
+from yacommon.cache import CacheNamespace, invalidation
+
+AUTHOR_VERSION_KEY = 'author:{pk}:version'
+LIST_PAGE_KEY = 'author:{pk}:list:{version}:{per_page}:{cursor}'
+NOTE_KEY = 'author:{pk}:note:{version}:{slug}'
+
+notes_cache = CacheNamespace('notes')
+
+
+def author_version(author_pk):
+    return notes_cache.version(AUTHOR_VERSION_KEY.format(pk=author_pk))
+
+
+@invalidation
+def bump_author_version(author_pk):
+    """Заметки автора изменились: сбрасываем его список и заметки."""
+    notes_cache.bump(AUTHOR_VERSION_KEY.format(pk=author_pk))
+
+
+def list_page_key(author_pk, cursor):
+    return LIST_PAGE_KEY.format(
+        pk=author_pk,
+        version=author_version(author_pk),
+        per_page=settings.NOTES_COUNT_ON_LIST_PAGE,
+        cursor=cursor or '',
+    )
+
+
+def note_key(author_pk, slug):
+    return NOTE_KEY.format(
+        pk=author_pk, version=author_version(author_pk), slug=slug
+    )
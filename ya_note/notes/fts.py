@@ -0,0 +1,43 @@
+"""
+Схема полнотекстового индекса заметок в SQLite.
+
+Используется поиском и командой rebuild_search_index. Миграции
+хранят свою, зафиксированную копию этих SQL.
+"""
+TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS notes_note_fts USING fts5("
+    "title, text, author_id, "
+    "content='notes_note', content_rowid='id')"
+)
+
+# Строка 'delete' внешнего индекса должна повторять все
+# проиндексированные колонки, иначе FTS5 не найдёт удаляемые токены.
+TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_insert "
+    "AFTER INSERT ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts(rowid, title, text, author_id) "
+    "VALUES (new.id, new.title, new.text, new.author_id); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_delete "
+    "AFTER DELETE ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts("
+    "notes_note_fts, rowid, title, text, author_id) "
+    "VALUES ('delete', old.id, old.title, old.text, old.author_id); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_update "
+    "AFTER UPDATE ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts("
+    "notes_note_fts, rowid, title, text, author_id) "
+    "VALUES ('delete', old.id, old.title, old.text, old.author_id); "
+    "INSERT INTO notes_note_fts(rowid, title, text, author_id) "
+    "VALUES (new.id, new.title, new.text, new.author_id); END",
+)
+
+SCHEMA = (TABLE, *TRIGGERS)
+
+REBUILD = "INSERT INTO notes_note_fts(notes_note_fts) VALUES ('rebuild')"
+
+# rank = 1 сверяет индекс с содержимым notes_note, а не только
+# его внутреннюю структуру.
+INTEGRITY_CHECK = (
+    "INSERT INTO notes_note_fts(notes_note_fts, rank) "
+    "VALUES ('integrity-check', 1)"
+)
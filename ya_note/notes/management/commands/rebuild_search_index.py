@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from notes.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Пересоздаёт полнотекстовый индекс заметок.'
+
+    def handle(self, *args, **options):
+        if rebuild_search_index():
+            self.stdout.write(self.style.SUCCESS('Индекс заметок обновлён.'))
+        else:
+            self.stdout.write('Полнотекстовый индекс есть только в SQLite.')
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS notes_note_fts USING fts5("
+    "title, text, author_id, "
+    "content='notes_note', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_insert "
+    "AFTER INSERT ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts(rowid, title, text, author_id) "
+    "VALUES (new.id, new.title, new.text, new.author_id); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_delete "
+    "AFTER DELETE ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts("
+    "notes_note_fts, rowid, title, text, author_id) "
+    "VALUES ('delete', old.id, old.title, old.text, old.author_id); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_note_fts_update "
+    "AFTER UPDATE ON notes_note BEGIN "
+    "INSERT INTO notes_note_fts("
+    "notes_note_fts, rowid, title, text, author_id) "
+    "VALUES ('delete', old.id, old.title, old.text, old.author_id); "
+    "INSERT INTO notes_note_fts(rowid, title, text, author_id) "
+    "VALUES (new.id, new.title, new.text, new.author_id); END",
+    "INSERT INTO notes_note_fts(notes_note_fts) VALUES ('rebuild')",
+)
+
+DROP = (
+    'DROP TRIGGER IF EXISTS notes_note_fts_insert',
+    'DROP TRIGGER IF EXISTS notes_note_fts_delete',
+    'DROP TRIGGER IF EXISTS notes_note_fts_update',
+    'DROP TABLE IF EXISTS notes_note_fts',
+)
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_note_author_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(SCHEMA), run(DROP)),
+    ]
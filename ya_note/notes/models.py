@@ -1,7 +1,61 @@
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
 
-from pytils.translit import slugify
+from .cache import bump_author_version
+from .slugs import allocate_slugs, base_slug
+
+# Сколько раз пробуем выделить slug заново при гонке одноимённых заметок.
+SLUG_ATTEMPTS = 3
+
+
+class NoteQuerySet(models.QuerySet):
+    """
+    Массовые операции с заметками.
+
+    Сигналы при bulk_create и update не отправляются, поэтому кеш
+    заметок затронутых авторов сбрасывается здесь же.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = self._bulk_create(list(objs), *args, **kwargs)
+        self._authors_changed({obj.author_id for obj in objs})
+        return objs
+
+    def update(self, **kwargs):
+        author_ids = set(self.values_list('author_id', flat=True))
+        rows = super().update(**kwargs)
+        author = kwargs.get('author', kwargs.get('author_id'))
+        if author is not None:
+            author_ids.add(getattr(author, 'pk', author))
+        self._authors_changed(author_ids)
+        return rows
+
+    @staticmethod
+    def _authors_changed(author_ids):
+        for author_id in author_ids:
+            bump_author_version(author_id)
+
+    def _bulk_create(self, objs, *args, **kwargs):
+        """Пустые slug пачки заметок выделяются одним проходом."""
+        without_slug = [obj for obj in objs if not obj.slug]
+        if not without_slug:
+            return super().bulk_create(objs, *args, **kwargs)
+        max_length = self.model._meta.get_field('slug').max_length
+        bases = [base_slug(obj.title, max_length) for obj in without_slug]
+        reserved = [obj.slug for obj in objs if obj.slug]
+        for attempt in range(SLUG_ATTEMPTS):
+            slugs = allocate_slugs(
+                self.model._default_manager.all(), bases, max_length,
+                reserved=reserved
+            )
+            for obj, slug in zip(without_slug, slugs):
+                obj.slug = slug
+            try:
+                with transaction.atomic(using=self.db):
+                    return super().bulk_create(objs, *args, **kwargs)
+            except IntegrityError:
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
 
 
 class Note(models.Model):
@@ -28,11 +82,36 @@ class Note(models.Model):
         on_delete=models.CASCADE,
     )
 
+    objects = NoteQuerySet.as_manager()
+
+    class Meta:
+        indexes = (
+            models.Index(fields=('author', 'id'), name='note_author_id_idx'),
+        )
+
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            max_slug_length = self._meta.get_field('slug').max_length
-            self.slug = slugify(self.title)[:max_slug_length]
-        super().save(*args, **kwargs)
+        """
+        Если slug не задан, выделяем свободный по заголовку.
+
+        Одноимённая заметка, созданная параллельно, может занять
+        тот же slug — тогда выделяем его заново.
+        """
+        if self.slug:
+            return super().save(*args, **kwargs)
+        max_slug_length = self._meta.get_field('slug').max_length
+        base = base_slug(self.title, max_slug_length)
+        for attempt in range(SLUG_ATTEMPTS):
+            self.slug, = allocate_slugs(
+                type(self)._default_manager.all(), [base], max_slug_length,
+                exclude_pk=self.pk
+            )
+            try:
+                with transaction.atomic(using=kwargs.get('using')):
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                self.slug = ''
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
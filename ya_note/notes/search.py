@@ -0,0 +1,69 @@
+"""
+Полнотекстовый поиск по заметкам.
+
+На SQLite индекс — виртуальная таблица FTS5 notes_note_fts поверх
+заголовка, текста и автора notes_note, которую триггеры
+синхронизируют при любой записи, включая массовые операции.
+SQLite пересоздаёт таблицу при некоторых изменениях схемы и теряет
+триггеры, поэтому после таких миграций нужно выполнить команду
+rebuild_search_index. На других СУБД используется медленный поиск
+через icontains.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .fts import REBUILD, SCHEMA
+from .models import Note
+
+TOKENS = re.compile(r'\w+')
+
+SEARCH_SQL = (
+    'SELECT notes_note.id, notes_note.title, notes_note.slug '
+    'FROM notes_note_fts '
+    'JOIN notes_note ON notes_note.id = notes_note_fts.rowid '
+    'WHERE notes_note_fts MATCH %s AND notes_note.author_id = %s '
+    'ORDER BY notes_note_fts.rank '
+    'LIMIT %s OFFSET %s'
+)
+
+
+def match_expression(query, author):
+    """
+    Выражение MATCH: все слова запроса как префиксы в заголовке
+    или тексте и автор как отдельный токен.
+
+    Автор в индексе позволяет FTS5 сразу пересечь списки документов,
+    а не ранжировать совпадения всех пользователей.
+    «кот дом» → author_id:"1" AND {title text}: ("кот"* "дом"*).
+    """
+    tokens = ' '.join(f'"{token}"*' for token in TOKENS.findall(query))
+    if not tokens:
+        return ''
+    return f'author_id:"{author.pk}" AND {{title text}}: ({tokens})'
+
+
+def search_notes(author, query, limit, offset=0):
+    """Заметки автора, подходящие под запрос, от лучших к худшим."""
+    expression = match_expression(query, author)
+    if not expression:
+        return []
+    if connection.vendor != 'sqlite':
+        return list(Note.objects.filter(
+            Q(title__icontains=query) | Q(text__icontains=query),
+            author=author,
+        ).only('id', 'title', 'slug').order_by('id')[offset:offset + limit])
+    return list(Note.objects.raw(
+        SEARCH_SQL, [expression, author.pk, limit, offset]
+    ))
+
+
+def rebuild_search_index():
+    """Создаём недостающие таблицу и триггеры и переиндексируем заметки."""
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        for statement in (*SCHEMA, REBUILD):
+            cursor.execute(statement)
+    return True
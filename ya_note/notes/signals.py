@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_author_version
+from .models import Note
+
+
+@receiver(post_save, sender=Note)
+@receiver(post_delete, sender=Note)
+def invalidate_author_notes(sender, instance, **kwargs):
+    """Создание, правка и удаление заметки сбрасывают кеш её автора."""
+    bump_author_version(instance.author_id)
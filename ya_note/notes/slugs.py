@@ -0,0 +1,120 @@
+"""Транслитерация заголовков и выделение уникальных slug для заметок."""
+import re
+from functools import lru_cache
+
+from django.db.models import Q
+from pytils.translit import ALPHABET, TRANSTABLE
+
+DEFAULT_SLUG = 'note'
+# Место под суффикс вида «-99999» у длинных slug.
+SUFFIX_RESERVE = 6
+# Сколько базовых slug проверяется одним запросом.
+BATCH_SIZE = 200
+# Сколько последних заголовков помнит slugify.
+SLUGIFY_CACHE_SIZE = 4096
+
+AMPERSAND = re.compile(r'&amp;|&')
+SEPARATORS = re.compile(r'[-\s]+')
+NOT_SLUG = re.compile(r'[^\w-]')
+
+
+class TranslitTable(dict):
+    """Таблица для str.translate: символы вне алфавита удаляются."""
+
+    def __missing__(self, code):
+        return None
+
+
+def _build_table():
+    """
+    Посимвольная таблица, повторяющая pytils.translit.slugify.
+
+    pytils выбрасывает символы вне своего алфавита, заменяет
+    остальные по TRANSTABLE (первая замена выигрывает) и удаляет
+    из результата всё, кроме букв, цифр и дефиса, — здесь всё это
+    сведено в один проход str.translate.
+    """
+    table = TranslitTable()
+    for symbol in ALPHABET:
+        if len(symbol) != 1 or ord(symbol) in table:
+            continue
+        replacement = next(
+            (target for source, target in TRANSTABLE if source == symbol),
+            symbol
+        )
+        table[ord(symbol)] = NOT_SLUG.sub('', replacement)
+    return table
+
+
+TABLE = _build_table()
+
+
+@lru_cache(maxsize=SLUGIFY_CACHE_SIZE)
+def slugify(title):
+    """Slug из заголовка, совпадающий с результатом pytils."""
+    text = AMPERSAND.sub(' and ', str(title).lower())
+    return SEPARATORS.sub('-', text).translate(TABLE)
+
+
+def base_slug(title, max_length):
+    return slugify(title)[:max_length] or DEFAULT_SLUG
+
+
+def _stem(base, max_length):
+    return base[:max_length - SUFFIX_RESERVE]
+
+
+def _taken_slugs(queryset, bases, max_length):
+    """
+    Занятые slug, совпадающие с базовыми или продолжающие их суффиксом.
+
+    Для каждой базы это равенство и диапазон ('stem-', 'stem.'),
+    который обслуживается уникальным индексом по slug.
+    """
+    taken = set()
+    for start in range(0, len(bases), BATCH_SIZE):
+        condition = Q()
+        for base in bases[start:start + BATCH_SIZE]:
+            stem = _stem(base, max_length)
+            condition |= Q(slug=base) | Q(
+                slug__gt=f'{stem}-', slug__lt=f'{stem}.'
+            )
+        taken.update(queryset.filter(condition).values_list('slug', flat=True))
+    return taken
+
+
+def _max_suffix(stem, taken):
+    prefix = f'{stem}-'
+    return max(
+        (int(slug[len(prefix):]) for slug in taken
+         if slug.startswith(prefix) and slug[len(prefix):].isdigit()),
+        default=1
+    )
+
+
+def allocate_slugs(queryset, bases, max_length, exclude_pk=None,
+                   reserved=()):
+    """
+    Уникальные slug для списка базовых: «base», «base-2», «base-3»…
+
+    Все занятые варианты читаются одним запросом на BATCH_SIZE баз,
+    поэтому стоимость не растёт с числом одноимённых заметок.
+    reserved — slug, уже занятые в текущей пачке объектов.
+    """
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    unique_bases = list(dict.fromkeys(bases))
+    taken = _taken_slugs(queryset, unique_bases, max_length) | set(reserved)
+    suffixes = {}
+    slugs = []
+    for base in bases:
+        slug = base
+        if slug in taken:
+            stem = _stem(base, max_length)
+            if stem not in suffixes:
+                suffixes[stem] = _max_suffix(stem, taken)
+            suffixes[stem] += 1
+            slug = f'{stem}-{suffixes[stem]}'
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
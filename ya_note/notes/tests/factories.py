@@ -0,0 +1,11 @@
+"""Фабрики заметок: объекты создаются пачками через bulk_create."""
+from notes.models import Note
+from yacommon.testing import bulk_create
+
+
+def make_notes(author, count, title='Заметка {index}', text='Текст'):
+    """Создаём count заметок автора, slug выделяет bulk_create."""
+    return bulk_create(Note, (
+        Note(title=title.format(index=index), text=text, author=author)
+        for index in range(count)
+    ))
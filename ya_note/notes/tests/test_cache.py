@@ -0,0 +1,73 @@
+"""Тесты общего слоя кеширования."""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from notes.cache import author_version
+from notes.models import Note
+from yacommon.cache import CacheNamespace
+
+User = get_user_model()
+
+
+class TestCacheNamespace(SimpleTestCase):
+    """Класс проверки пространства ключей кеша."""
+
+    def setUp(self):
+        """Пустой кеш и новое пространство на каждый тест."""
+        cache.clear()
+        self.namespace = CacheNamespace('test')
+
+    def test_get_or_set_computes_once(self):
+        """Тест значение считается один раз и дальше берётся из кеша."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return 'значение'
+
+        for _ in range(2):
+            self.assertEqual(
+                self.namespace.get_or_set('key', compute, 60), 'значение'
+            )
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.namespace.stats['misses'], 1)
+        self.assertEqual(self.namespace.stats['hits'], 1)
+
+    def test_bump_changes_version(self):
+        """Тест после сброса версия набора данных другая."""
+        version = self.namespace.version('version')
+        self.namespace.bump('version')
+        self.assertNotEqual(self.namespace.version('version'), version)
+
+
+class TestInvalidationAfterCommit(TestCase):
+    """Класс проверки сброса кеша автора после коммита."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(username='Автор')
+
+    def assert_bumped_after_commit(self, change):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            change()
+            version = author_version(self.author.pk)
+        self.assertTrue(callbacks)
+        self.assertNotEqual(author_version(self.author.pk), version)
+
+    def test_save_bumps_after_commit(self):
+        """Тест сохранение заметки ещё раз сбрасывает кеш после коммита."""
+        self.assert_bumped_after_commit(lambda: Note.objects.create(
+            title='Заголовок', text='Текст', author=self.author
+        ))
+
+    def test_bulk_update_bumps_after_commit(self):
+        """Тест массовая правка ещё раз сбрасывает кеш после коммита."""
+        Note.objects.create(
+            title='Заголовок', text='Текст', author=self.author
+        )
+        self.assert_bumped_after_commit(
+            lambda: Note.objects.filter(author=self.author).update(
+                text='Новый текст'
+            )
+        )
@@ -1,9 +1,13 @@
 """Тесты проверки контекста"""
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.db import connection
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
+from notes.fts import INTEGRITY_CHECK
 from notes.models import Note
+from notes.tests.factories import make_notes
+from yacommon.testing import make_users
 
 User = get_user_model()
 
@@ -61,3 +65,95 @@ class TestRoutes(TestCase):
                 url = reverse(name, args=args)
                 response = self.client.get(url)
                 self.assertIn('form', response.context)
+
+    @override_settings(NOTES_COUNT_ON_LIST_PAGE=2)
+    def test_notes_list_is_paginated(self):
+        """
+        Тест список заметок выводится страницами,
+        следующая открывается по курсору.
+        """
+        notes = make_notes(self.author, 2)
+        self.client.force_login(self.author)
+        url = reverse('notes:list')
+        response = self.client.get(url)
+        self.assertEqual(list(response.context['object_list']),
+                         [self.note, notes[0]])
+        response = self.client.get(
+            url, {'cursor': response.context['next_cursor']}
+        )
+        self.assertEqual(list(response.context['object_list']), [notes[1]])
+        self.assertIsNone(response.context['next_cursor'])
+
+    def test_search_finds_only_own_notes(self):
+        """
+        Тест поиск находит заметки по словам заголовка и текста,
+        но только заметки самого пользователя.
+        """
+        Note.objects.create(title='Чужие планы', text='Отпуск в горах',
+                            author=self.auth_user)
+        own_note = Note.objects.create(title='Планы', text='Отпуск на море',
+                                       author=self.author)
+        self.client.force_login(self.author)
+        response = self.client.get(reverse('notes:search'), {'q': 'отпус'})
+        self.assertEqual(list(response.context['object_list']), [own_note])
+
+    def test_search_index_follows_changes(self):
+        """Тест изменённая и удалённая заметка ищутся по новому тексту."""
+        self.client.force_login(self.author)
+        url = reverse('notes:search')
+        self.note.text = 'Купить молоко'
+        self.note.save()
+        response = self.client.get(url, {'q': 'молоко'})
+        self.assertEqual(list(response.context['object_list']), [self.note])
+        self.note.delete()
+        response = self.client.get(url, {'q': 'молоко'})
+        self.assertEqual(list(response.context['object_list']), [])
+
+    def test_search_index_intact_after_edit(self):
+        """Тест после правки заметки индекс проходит integrity-check."""
+        self.note.title = 'Новый заголовок'
+        self.note.save()
+        with connection.cursor() as cursor:
+            cursor.execute(INTEGRITY_CHECK)
+
+
+class TestNotesVolume(TestCase):
+    """Список и поиск на тысячах заметок."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author, cls.reader = make_users(2)
+        cls.notes = make_notes(cls.author, 2000)
+        make_notes(cls.reader, 500)
+
+    def setUp(self):
+        self.client.force_login(self.author)
+
+    def test_list_walk_covers_all_notes(self):
+        """Тест по курсорам список проходится целиком по запросу на стр."""
+        url = reverse('notes:list')
+        seen = []
+        params = {}
+        while True:
+            with self.assertNumQueries(1):
+                response = self.client.get(url, params)
+            seen += [note.pk for note in response.context['object_list']]
+            if response.context['next_cursor'] is None:
+                break
+            params = {'cursor': response.context['next_cursor']}
+        self.assertEqual(seen, [note.pk for note in self.notes])
+
+    def test_slugs_are_unique(self):
+        """Тест пакетное создание выдало всем заметкам разные slug."""
+        slugs = Note.objects.values_list('slug', flat=True)
+        self.assertEqual(len(set(slugs)), len(slugs))
+
+    def test_search_pages(self):
+        """Тест поиск листается страницами только по своим заметкам."""
+        url = reverse('notes:search')
+        response = self.client.get(url, {'q': 'заметка', 'page': 2})
+        self.assertTrue(response.context['has_next'])
+        self.assertTrue(all(
+            note.author_id == self.author.pk
+            for note in response.context['object_list']
+        ))
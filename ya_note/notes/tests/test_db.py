@@ -0,0 +1,44 @@
+"""Тесты настроек базы данных."""
+import os
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from yacommon.db import database_config
+
+
+class TestDatabaseConfig(SimpleTestCase):
+    """Конфигурация базы из переменных окружения."""
+
+    def test_default_sqlite(self):
+        """Тест по умолчанию SQLite проекта с постоянными соединениями."""
+        with mock.patch.dict(os.environ, clear=True):
+            config = database_config('/tmp/notes.sqlite3')
+        self.assertEqual(config['ENGINE'], 'yacommon.db.backends.sqlite3')
+        self.assertEqual(config['NAME'], '/tmp/notes.sqlite3')
+        self.assertEqual(config['CONN_MAX_AGE'], 60)
+
+    def test_postgres_with_pool(self):
+        """Тест PostgreSQL с пулом не держит соединения между запросами."""
+        with mock.patch.dict(os.environ, {
+            'DATABASE_URL': 'postgres://notes:secret@db:5432/notes',
+            'DB_POOL_SIZE': '10',
+        }):
+            config = database_config('/tmp/notes.sqlite3')
+        self.assertEqual(config['ENGINE'], 'yacommon.db.backends.postgresql')
+        self.assertEqual(
+            (config['USER'], config['HOST'], config['PORT']),
+            ('notes', 'db', '5432')
+        )
+        self.assertEqual(config['POOL_SIZE'], 10)
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+
+
+class TestSqlitePragmas(TestCase):
+
+    def test_pragmas_applied(self):
+        """Тест соединение SQLite получает настроенные PRAGMA."""
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)
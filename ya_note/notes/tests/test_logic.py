@@ -1,13 +1,19 @@
 """Тесты логики приложения"""
+import json
 from http import HTTPStatus
+from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from pytils.translit import slugify
 
 from notes.forms import WARNING
 from notes.models import Note
+from notes.slugs import slugify as notes_slugify
 
 User = get_user_model()
 
@@ -127,3 +133,186 @@ class TestRoutes(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
         notes_count = Note.objects.count()
         self.assertEqual(notes_count, notes_count_before_delete)
+
+
+class TestSlugAllocation(TestCase):
+    """Класс проверки выделения уникальных slug."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Переменные класса."""
+        cls.author = User.objects.create(username='testAuthor')
+        cls.title = 'Одинаковый заголовок'
+        cls.slug = slugify(cls.title)
+
+    def test_same_titles_get_suffixes(self):
+        """Тест одноимённые заметки получают slug с суффиксами."""
+        notes = [Note.objects.create(title=self.title, text='Текст',
+                                     author=self.author)
+                 for _ in range(3)]
+        self.assertEqual([note.slug for note in notes],
+                         [self.slug, f'{self.slug}-2', f'{self.slug}-3'])
+
+    def test_allocation_is_one_query(self):
+        """Тест свободный slug ищется одним запросом при любом числе дублей."""
+        Note.objects.bulk_create(
+            Note(title=self.title, text='Текст', author=self.author)
+            for _ in range(20)
+        )
+        with CaptureQueriesContext(connection) as context:
+            note = Note.objects.create(title=self.title, text='Текст',
+                                       author=self.author)
+        selects = [query for query in context.captured_queries
+                   if query['sql'].startswith('SELECT')]
+        self.assertEqual(len(selects), 1)
+        self.assertEqual(note.slug, f'{self.slug}-21')
+
+    def test_bulk_create_allocates_unique_slugs(self):
+        """Тест массовое создание выделяет уникальные slug пачке заметок."""
+        Note.objects.create(title=self.title, text='Текст',
+                            author=self.author)
+        notes = Note.objects.bulk_create(
+            Note(title=self.title, text='Текст', author=self.author)
+            for _ in range(3)
+        )
+        self.assertEqual([note.slug for note in notes],
+                         [f'{self.slug}-2', f'{self.slug}-3',
+                          f'{self.slug}-4'])
+
+    def test_slugify_matches_pytils(self):
+        """Тест табличная транслитерация совпадает с pytils."""
+        for title in ('Щука & «ёлка» — №1…', 'Съешь ещё этих булок',
+                      'Mixed Заголовок_2024!', '', '¿?'):
+            with self.subTest(title=title):
+                self.assertEqual(notes_slugify(title), slugify(title))
+
+    def test_slug_allocated_again_after_race(self):
+        """Тест при гонке за slug он выделяется заново."""
+        Note.objects.create(title=self.title, text='Текст',
+                            author=self.author)
+        with mock.patch('notes.models.allocate_slugs',
+                        side_effect=([self.slug], [f'{self.slug}-2'])):
+            note = Note.objects.create(title=self.title, text='Текст',
+                                       author=self.author)
+        self.assertEqual(note.slug, f'{self.slug}-2')
+
+    def test_form_allocates_slug_for_duplicate_title(self):
+        """Тест форма без slug не падает на одноимённой заметке."""
+        Note.objects.create(title=self.title, text='Текст',
+                            author=self.author)
+        self.client.force_login(self.author)
+        response = self.client.post(reverse('notes:add'),
+                                    data={'title': self.title,
+                                          'text': 'Текст'})
+        self.assertRedirects(response, reverse('notes:success'))
+        self.assertTrue(Note.objects.filter(slug=f'{self.slug}-2').exists())
+
+
+class TestImportExport(TestCase):
+    """Импорт и экспорт заметок."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(username='testAuthor')
+        cls.reader = User.objects.create(username='testReader')
+        cls.note = Note.objects.create(title='Чужая заметка', text='Текст',
+                                       slug='taken', author=cls.reader)
+        cls.url_import = reverse('notes:import')
+        cls.url_export = reverse('notes:export')
+
+    def setUp(self):
+        self.client.force_login(self.author)
+
+    def upload(self, name, content):
+        return self.client.post(self.url_import, data={
+            'file': SimpleUploadedFile(name, content.encode())
+        })
+
+    @override_settings(NOTES_IMPORT_BATCH_SIZE=2)
+    def test_import_jsonl(self):
+        """Валидные строки сохраняются, ошибочные попадают в отчёт."""
+        lines = [
+            {'title': 'Первая', 'text': 'Текст'},
+            {'title': 'Первая', 'text': 'Текст'},
+            {'title': 'Своя', 'text': 'Текст', 'slug': 'own'},
+            {'title': 'Занятый', 'text': 'Текст', 'slug': 'taken'},
+            {'title': 'Без текста'},
+        ]
+        content = '\n'.join(json.dumps(line) for line in lines)
+        response = self.upload('notes.jsonl', content + '\n{oops\n')
+        result = response.context['result']
+        self.assertEqual(result.created, 3)
+        self.assertEqual([line for line, _ in result.errors], [4, 5, 6])
+        slugs = set(Note.objects.filter(
+            author=self.author).values_list('slug', flat=True))
+        self.assertEqual(slugs, {'pervaya', 'pervaya-2', 'own'})
+
+    def test_import_non_string_fields(self):
+        """Поля не-строки попадают в отчёт, а не роняют импорт."""
+        lines = [
+            {'title': 2024, 'text': 'Текст'},
+            {'title': 'Список', 'text': ['a']},
+            {'title': 'Пустой slug', 'text': 'Текст', 'slug': None},
+        ]
+        content = '\n'.join(json.dumps(line) for line in lines)
+        response = self.upload('notes.jsonl', content)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        result = response.context['result']
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.errors, [
+            (1, 'title: ожидается строка'), (2, 'text: ожидается строка')
+        ])
+
+    def test_import_conflict_counts_each_line_once(self):
+        """При конфликте сохранения ошибка пишется только строкам пачки."""
+        lines = [
+            {'title': 'Новая', 'text': 'Текст'},
+            {'title': 'Занятый', 'text': 'Текст', 'slug': 'taken'},
+        ]
+        content = '\n'.join(json.dumps(line) for line in lines)
+        with mock.patch.object(type(Note.objects), 'bulk_create',
+                               side_effect=IntegrityError):
+            response = self.upload('notes.jsonl', content)
+        result = response.context['result']
+        self.assertEqual(result.failed, 2)
+        self.assertEqual([line for line, _ in result.errors], [2, 1])
+
+    def test_import_csv(self):
+        """CSV разбирается по заголовку."""
+        response = self.upload(
+            'notes.csv', 'title,text,slug\nИз CSV,"Текст, с запятой",\n'
+        )
+        self.assertEqual(response.context['result'].created, 1)
+        note = Note.objects.get(author=self.author)
+        self.assertEqual(note.text, 'Текст, с запятой')
+        self.assertEqual(note.slug, 'iz-csv')
+
+    @override_settings(NOTES_EXPORT_CHUNK_SIZE=2)
+    def test_export_streams_only_own_notes(self):
+        """Экспорт отдаёт все свои заметки пачками."""
+        Note.objects.bulk_create(
+            Note(title=f'Заметка {index}', text='Текст', author=self.author)
+            for index in range(5)
+        )
+        response = self.client.get(self.url_export)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        rows = [json.loads(line) for line in
+                b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['title'] for row in rows],
+                         [f'Заметка {index}' for index in range(5)])
+        response = self.client.get(self.url_export, {'format': 'csv'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'title,text,slug')
+        self.assertEqual(len(lines), 6)
+
+    def test_export_roundtrip(self):
+        """Выгруженный файл загружается обратно."""
+        response = self.client.get(self.url_export)
+        self.assertEqual(b''.join(response.streaming_content), b'')
+        self.client.force_login(self.reader)
+        response = self.client.get(self.url_export)
+        content = b''.join(response.streaming_content).decode()
+        self.client.force_login(self.author)
+        response = self.upload('notes.jsonl', content.replace('taken', ''))
+        self.assertEqual(response.context['result'].created, 1)
@@ -0,0 +1,144 @@
+"""Тесты количества запросов к БД."""
+from http import HTTPStatus
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from notes.models import Note
+from notes.tests.factories import make_notes
+from yacommon.middleware import QueryBudgetExceeded
+
+User = get_user_model()
+
+# Сессия и пользователь авторизованного клиента берутся из кешей,
+# без них было бы 2 запроса.
+AUTH_QUERIES = 0
+
+
+@override_settings(QUERY_BUDGET_ACTION='raise')
+class TestQueries(TestCase):
+    """Класс проверки числа запросов на страницах заметок."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Переменные класса."""
+        cls.author = User.objects.create(username='testAuthor')
+        cls.note = Note.objects.create(title='Заголовок',
+                                       text='Текст',
+                                       slug='slug',
+                                       author=cls.author)
+        cls.form_data = {'title': 'Новый заголовок',
+                         'text': 'Новый текст',
+                         'slug': 'new-slug'}
+
+    def setUp(self):
+        """Логиним автора."""
+        self.client.force_login(self.author)
+
+    def test_get_pages_queries(self):
+        """Тест число запросов при открытии страниц."""
+        name_pages = (('notes:home', None, 0),
+                      ('notes:list', None, 1),
+                      ('notes:add', None, 0),
+                      ('notes:success', None, 0),
+                      ('notes:detail', (self.note.slug,), 1),
+                      ('notes:edit', (self.note.slug,), 1),
+                      ('notes:delete', (self.note.slug,), 1),)
+        for name, args, queries in name_pages:
+            with self.subTest(name=name):
+                url = reverse(name, args=args)
+                with self.assertNumQueries(AUTH_QUERIES + queries):
+                    self.client.get(url)
+
+    def test_create_note_queries(self):
+        """Тест создание заметки не сохраняет её дважды."""
+        with self.assertNumQueries(AUTH_QUERIES + 2):
+            self.client.post(reverse('notes:add'), data=self.form_data)
+
+    def test_edit_note_queries(self):
+        """Тест редактирование заметки."""
+        url = reverse('notes:edit', args=(self.note.slug,))
+        with self.assertNumQueries(AUTH_QUERIES + 3):
+            self.client.post(url, data=self.form_data)
+        self.note.refresh_from_db()
+        self.assertEqual(self.note.slug, self.form_data['slug'])
+
+    def test_delete_note_queries(self):
+        """Тест удаление заметки."""
+        url = reverse('notes:delete', args=(self.note.slug,))
+        with self.assertNumQueries(AUTH_QUERIES + 2):
+            self.client.post(url)
+
+    def test_server_timing_header(self):
+        """Тест ответ содержит заголовок Server-Timing с числом запросов."""
+        response = self.client.get(reverse('notes:list'))
+        self.assertIn('queries', response['Server-Timing'])
+
+    @override_settings(QUERY_BUDGETS={'notes:list': 0})
+    def test_query_budget_exceeded(self):
+        """Тест превышение бюджета запросов приводит к ошибке."""
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse('notes:list'))
+
+
+class TestNotesCache(TestCase):
+    """Класс проверки кеша списка и заметок автора."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Переменные класса."""
+        cls.author = User.objects.create(username='testAuthor')
+        cls.reader = User.objects.create(username='testReader')
+        cls.note = Note.objects.create(title='Заголовок',
+                                       text='Текст',
+                                       slug='slug',
+                                       author=cls.author)
+        cls.list_url = reverse('notes:list')
+        cls.detail_url = reverse('notes:detail', args=(cls.note.slug,))
+
+    def setUp(self):
+        """Логиним автора и читателя."""
+        self.client.force_login(self.author)
+        self.reader_client = Client()
+        self.reader_client.force_login(self.reader)
+
+    def test_repeated_pages_served_from_cache(self):
+        """Тест повторные список и заметка открываются без запросов."""
+        for url in (self.list_url, self.detail_url):
+            with self.subTest(url=url):
+                with self.assertNumQueries(AUTH_QUERIES + 1):
+                    self.client.get(url)
+                with self.assertNumQueries(AUTH_QUERIES):
+                    response = self.client.get(url)
+                self.assertContains(response, self.note.title)
+
+    def test_views_invalidate_cache(self):
+        """Тест создание, правка и удаление заметки видны сразу."""
+        self.client.get(self.list_url)
+        self.client.get(self.detail_url)
+        self.client.post(reverse('notes:add'), data={
+            'title': 'Новая заметка', 'text': 'Текст', 'slug': 'new'
+        })
+        self.assertContains(self.client.get(self.list_url), 'Новая заметка')
+        self.client.post(reverse('notes:edit', args=(self.note.slug,)), data={
+            'title': 'Исправлено', 'text': 'Текст', 'slug': self.note.slug
+        })
+        self.assertContains(self.client.get(self.detail_url), 'Исправлено')
+        self.client.post(reverse('notes:delete', args=(self.note.slug,)))
+        self.assertEqual(self.client.get(self.detail_url).status_code,
+                         HTTPStatus.NOT_FOUND)
+
+    def test_bulk_create_invalidates_cache(self):
+        """Тест заметки из bulk_create появляются в закешированном списке."""
+        self.client.get(self.list_url)
+        note, = make_notes(self.author, 1, title='Из импорта')
+        self.assertContains(self.client.get(self.list_url), note.title)
+
+    def test_other_authors_cache_kept(self):
+        """Тест запись одного автора не сбрасывает кеш другого."""
+        self.reader_client.get(self.list_url)
+        Note.objects.create(title='Ещё заметка', text='Текст',
+                            author=self.author)
+        with self.assertNumQueries(AUTH_QUERIES):
+            self.reader_client.get(self.list_url)
@@ -0,0 +1,19 @@
+"""Тесты прогрева кеша шаблонов."""
+from django.template import engines
+from django.test import TestCase, override_settings
+
+from yacommon.templates import warm_templates
+from yanote.settings import prod
+
+
+class TestTemplates(TestCase):
+    """Класс проверки кеширующего загрузчика продакшен-профиля."""
+
+    @override_settings(TEMPLATES=prod.TEMPLATES)
+    def test_prod_templates_are_warmed(self):
+        """Тест все шаблоны заметок попадают в кеш загрузчика."""
+        self.assertGreater(warm_templates(), 0)
+        loader, = engines['django'].engine.template_loaders
+        for name in ('notes/list.html', 'includes/header.html'):
+            with self.subTest(name=name):
+                self.assertIn(name, loader.get_template_cache)
@@ -0,0 +1,178 @@
+"""Потоковый импорт и экспорт заметок в JSON Lines и CSV."""
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+
+from .models import Note
+
+FIELDS = ('title', 'text', 'slug')
+CSV = 'csv'
+JSONL = 'jsonl'
+CONTENT_TYPES = {
+    CSV: 'text/csv; charset=utf-8',
+    JSONL: 'application/x-ndjson; charset=utf-8',
+}
+# Сколько ошибок импорта показываем пользователю.
+MAX_ERRORS = 100
+
+
+class ImportResult:
+
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line, message):
+        self.failed += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+
+def detect_format(filename):
+    return CSV if filename.lower().endswith('.csv') else JSONL
+
+
+def read_records(upload):
+    """
+    Построчно читаем загруженный файл, не загружая его целиком.
+
+    Отдаём пары (номер строки, словарь полей или текст ошибки).
+    """
+    text = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+    try:
+        if detect_format(upload.name) == CSV:
+            reader = csv.DictReader(text)
+            for record in reader:
+                yield reader.line_num, record
+            return
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                yield line_number, f'некорректный JSON: {error}'
+                continue
+            if not isinstance(record, dict):
+                yield line_number, 'ожидается JSON-объект'
+                continue
+            yield line_number, record
+    except UnicodeDecodeError:
+        yield None, 'файл должен быть в кодировке UTF-8'
+
+
+def _validation_message(error):
+    return '; '.join(
+        f'{field}: {message}'
+        for field, messages in error.message_dict.items()
+        for message in messages
+    )
+
+
+def _record_fields(record):
+    """
+    Строковые поля записи без пробелов по краям.
+
+    Отсутствующее поле и null считаются пустой строкой, значение
+    другого типа — ошибкой строки, а не падением импорта.
+    """
+    fields = {}
+    for field in FIELDS:
+        value = record.get(field)
+        if value is None:
+            value = ''
+        if not isinstance(value, str):
+            raise ValidationError({field: 'ожидается строка'})
+        fields[field] = value.strip()
+    return fields
+
+
+def import_notes(author, records, batch_size):
+    """
+    Проверяем записи по одной и сохраняем пачками через bulk_create.
+
+    Поля проверяются без запросов к БД; занятость явно заданных slug
+    проверяется одним запросом на пачку, а пустые slug выделяет
+    Note.objects.bulk_create.
+    """
+    result = ImportResult()
+    batch = []
+    for line, record in records:
+        if isinstance(record, str):
+            result.add_error(line, record)
+            continue
+        try:
+            note = Note(author=author, **_record_fields(record))
+            note.full_clean(exclude=('author',), validate_unique=False)
+        except ValidationError as error:
+            result.add_error(line, _validation_message(error))
+            continue
+        batch.append((line, note))
+        if len(batch) >= batch_size:
+            _save_batch(batch, result)
+            batch = []
+    if batch:
+        _save_batch(batch, result)
+    return result
+
+
+def _save_batch(batch, result):
+    explicit = {note.slug for _, note in batch if note.slug}
+    taken = set(
+        Note.objects.filter(slug__in=explicit).values_list('slug', flat=True)
+    )
+    notes = []
+    for line, note in batch:
+        if note.slug and note.slug in taken:
+            result.add_error(line, f'slug: {note.slug} уже существует')
+            continue
+        if note.slug:
+            taken.add(note.slug)
+        notes.append((line, note))
+    try:
+        Note.objects.bulk_create(note for _, note in notes)
+    except IntegrityError:
+        for line, _ in notes:
+            result.add_error(line, 'конфликт при сохранении, повторите')
+        return
+    result.created += len(notes)
+
+
+class Echo:
+    """Псевдофайл для csv.writer, возвращающий записанную строку."""
+
+    def write(self, value):
+        return value
+
+
+def export_notes(queryset, export_format, chunk_size):
+    """
+    Генератор строк экспорта.
+
+    Заметки читаются пачками по id, так что в памяти никогда
+    не держится больше chunk_size записей.
+    """
+    writer = csv.writer(Echo())
+    if export_format == CSV:
+        yield writer.writerow(FIELDS)
+    last_id = 0
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).order_by('id').values_list(
+                'id', *FIELDS
+            )[:chunk_size]
+        )
+        if not chunk:
+            return
+        for note_id, *values in chunk:
+            if export_format == CSV:
+                yield writer.writerow(values)
+            else:
+                yield json.dumps(
+                    dict(zip(FIELDS, values)), ensure_ascii=False
+                ) + '\n'
+        last_id = chunk[-1][0]
@@ -1,9 +1,18 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, StreamingHttpResponse
 from django.urls import reverse_lazy
 from django.views import generic
 
-from .forms import NoteForm
+from .cache import list_page_key, note_key, notes_cache
+from .forms import NoteForm, NoteImportForm
 from .models import Note
+from .search import search_notes
+from .transfer import (
+    CONTENT_TYPES, CSV, JSONL, export_notes, import_notes, read_records
+)
+
+CURSOR = 'cursor'
 
 
 class Home(generic.TemplateView):
@@ -32,9 +41,7 @@ class NoteCreate(NoteBase, generic.CreateView):
     form_class = NoteForm
 
     def form_valid(self, form):
-        new_note = form.save(commit=False)
-        new_note.author = self.request.user
-        new_note.save()
+        form.instance.author = self.request.user
         return super().form_valid(form)
 
 
@@ -50,10 +57,126 @@ class NoteDelete(NoteBase, generic.DeleteView):
 
 
 class NotesList(NoteBase, generic.ListView):
-    """Список всех заметок пользователя."""
+    """Список заметок пользователя постранично."""
     template_name = 'notes/list.html'
 
+    def get_queryset(self):
+        """
+        Страница заметок с id больше курсора из запроса.
+
+        Страницы кешируются для каждого автора до изменения его заметок.
+        """
+        after = self.request.GET.get(CURSOR)
+        try:
+            after = int(after) if after else None
+        except ValueError:
+            raise Http404('Некорректный курсор страницы.')
+        notes, self.next_cursor = notes_cache.get_or_set(
+            list_page_key(self.request.user.pk, after),
+            lambda: self.load_page(after),
+            settings.NOTES_CACHE_TIMEOUT
+        )
+        return notes
+
+    def load_page(self, after):
+        """
+        Страница заметок из базы и курсор следующей.
+
+        Загружаем только поля, которые выводятся в списке, а поиск
+        страницы идёт по индексу (author, id) при любой её глубине.
+        """
+        per_page = settings.NOTES_COUNT_ON_LIST_PAGE
+        queryset = super().get_queryset().only(
+            'id', 'slug', 'title'
+        ).order_by('id')
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+        notes = list(queryset[:per_page + 1])
+        next_cursor = None
+        if len(notes) > per_page:
+            notes = notes[:per_page]
+            next_cursor = notes[-1].id
+        return notes, next_cursor
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['next_cursor'] = self.next_cursor
+        return context
+
 
 class NoteDetail(NoteBase, generic.DetailView):
     """Заметка подробно."""
     template_name = 'notes/detail.html'
+
+    def get_object(self, queryset=None):
+        """Заметка кешируется для автора до изменения его заметок."""
+        return notes_cache.get_or_set(
+            note_key(self.request.user.pk, self.kwargs[self.slug_url_kwarg]),
+            lambda: super(NoteDetail, self).get_object(queryset),
+            settings.NOTES_CACHE_TIMEOUT
+        )
+
+
+class NoteSearch(NoteBase, generic.ListView):
+    """Полнотекстовый поиск по заметкам пользователя."""
+    template_name = 'notes/search.html'
+
+    def get_queryset(self):
+        """Страница найденных заметок, лучшие совпадения первыми."""
+        per_page = settings.SEARCH_RESULTS_ON_PAGE
+        try:
+            self.page = max(int(self.request.GET.get('page', 1)), 1)
+        except ValueError:
+            raise Http404('Некорректный номер страницы.')
+        notes = search_notes(
+            self.request.user,
+            self.request.GET.get('q', ''),
+            per_page + 1,
+            (self.page - 1) * per_page
+        )
+        self.has_next = len(notes) > per_page
+        return notes[:per_page]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update(
+            query=self.request.GET.get('q', ''),
+            page=self.page,
+            has_next=self.has_next,
+        )
+        return context
+
+
+class NoteImport(NoteBase, generic.FormView):
+    """Импорт заметок из файла."""
+    template_name = 'notes/import.html'
+    form_class = NoteImportForm
+
+    def form_valid(self, form):
+        result = import_notes(
+            self.request.user,
+            read_records(form.cleaned_data['file']),
+            settings.NOTES_IMPORT_BATCH_SIZE
+        )
+        return self.render_to_response(
+            self.get_context_data(form=form, result=result)
+        )
+
+
+class NoteExport(NoteBase, generic.View):
+    """Потоковая выгрузка всех заметок пользователя."""
+
+    def get(self, request, *args, **kwargs):
+        export_format = CSV if request.GET.get('format') == CSV else JSONL
+        response = StreamingHttpResponse(
+            export_notes(
+                self.get_queryset(),
+                export_format,
+                settings.NOTES_EXPORT_CHUNK_SIZE
+            ),
+            content_type=CONTENT_TYPES[export_format]
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="notes.{export_format}"'
+        )
+        return response
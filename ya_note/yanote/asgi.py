@@ -11,6 +11,11 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from yacommon.templates import warm_templates
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'yanote.settings')
 
 application = get_asgi_application()
+
+# С кеширующим загрузчиком шаблоны разбираются до первого запроса.
+warm_templates()
@@ -0,0 +1,8 @@
+"""
+Настройки проекта по окружениям.
+
+base — общие для всех, dev — для разработки, prod — для развёртывания:
+DJANGO_SETTINGS_MODULE=yanote.settings.prod. Сам yanote.settings
+соответствует dev, им пользуются manage.py и тесты.
+"""
+from .dev import *  # noqa: F401,F403
@@ -1,8 +1,15 @@
+"""
+Общие настройки проекта для всех окружений.
+
+Профили dev и prod переопределяют отладку, шаблоны, кеш и middleware.
+"""
 from pathlib import Path
 
 from django.urls import reverse_lazy
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+from yacommon.db import database_config
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 SECRET_KEY = 'django-insecure-yipnj$#j!ajarq%k55z4kuf3x79)91h0h42o9!1ho(z=!%mt=#'
 
@@ -22,6 +29,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'yacommon.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,10 +61,18 @@ WSGI_APPLICATION = 'yanote.wsgi.application'
 
 
 DATABASES = {
+    'default': database_config(BASE_DIR / 'db.sqlite3'),
+}
+
+
+# Слой yacommon.cache добавляет к ключам пространство приложения,
+# KEY_PREFIX разделяет проекты, если они делят один кеш.
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'KEY_PREFIX': 'yanote',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
 }
 
 
@@ -85,5 +101,38 @@ STATIC_URL = '/static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Сессии читаются из кеша и записываются в кеш и БД.
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+AUTHENTICATION_BACKENDS = ['yacommon.auth.CachedModelBackend']
+
+# Сколько секунд пользователь сессии живёт в кеше процесса
+# и сколько пользователей кеш держит, вытесняя давно не нужных.
+USER_CACHE_TIMEOUT = 30
+USER_CACHE_MAX_ENTRIES = 1000
+
 LOGIN_URL = reverse_lazy('users:login')
 LOGIN_REDIRECT_URL = reverse_lazy('notes:home')
+
+NOTES_COUNT_ON_LIST_PAGE = 100
+
+# Сколько секунд страницы списка и заметки автора живут в кеше.
+NOTES_CACHE_TIMEOUT = 60 * 60
+
+SEARCH_RESULTS_ON_PAGE = 20
+
+NOTES_IMPORT_BATCH_SIZE = 500
+
+NOTES_EXPORT_CHUNK_SIZE = 2000
+
+# Максимальное число SQL-запросов на один HTTP-запрос по имени маршрута.
+QUERY_BUDGETS = {
+    'notes:list': 3,
+    'notes:detail': 3,
+    'notes:add': 4,
+    'notes:edit': 5,
+    'notes:delete': 4,
+}
+
+# 'log' — предупреждение в лог, 'raise' — исключение QueryBudgetExceeded.
+QUERY_BUDGET_ACTION = 'log'
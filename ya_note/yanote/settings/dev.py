@@ -0,0 +1,4 @@
+"""Профиль разработки: отладка, шаблоны перечитываются при каждом рендере."""
+from .base import *  # noqa: F401,F403
+
+DEBUG = True
@@ -0,0 +1,7 @@
+"""
+Общий код проектов ya_news и ya_note.
+
+Пакет лежит в корне репозитория; пакеты yanews и yanote при импорте
+добавляют корень в sys.path, поэтому manage.py, wsgi.py, asgi.py
+и тесты каждого проекта находят его без установки.
+"""
@@ -0,0 +1,95 @@
+"""
+Аутентификация с кешем пользователей в памяти процесса.
+
+AuthenticationMiddleware на каждый запрос загружает пользователя
+через backend.get_user(); CachedModelBackend отдаёт его из кеша
+на USER_CACHE_TIMEOUT секунд. Кеш сбрасывается при сохранении
+и удалении пользователя в этом процессе, а в других процессах запись
+живёт не дольше таймаута, поэтому он короткий.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model, user_logged_in
+from django.contrib.auth.backends import ModelBackend
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+User = get_user_model()
+
+
+class UserCache:
+    """
+    Значения полей пользователей по id с ограниченным сроком жизни.
+
+    Храним значения, а не объекты: каждый запрос получает свой
+    экземпляр модели, и изменения в одном запросе не видны другим.
+    Просроченная запись удаляется при обращении к ней, а сверх
+    USER_CACHE_MAX_ENTRIES вытесняются давно не читавшиеся.
+    """
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.attnames = [field.attname for field in User._meta.concrete_fields]
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._data[user_id]
+                return None
+            self._data.move_to_end(user_id)
+        expires, db, values = entry
+        return User.from_db(db, self.attnames, values)
+
+    def set(self, user):
+        values = [getattr(user, attname) for attname in self.attnames]
+        expires = time.monotonic() + settings.USER_CACHE_TIMEOUT
+        with self._lock:
+            self._data[user.pk] = (expires, user._state.db, values)
+            self._data.move_to_end(user.pk)
+            while len(self._data) > settings.USER_CACHE_MAX_ENTRIES:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+    def delete(self, user_id):
+        with self._lock:
+            self._data.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+user_cache = UserCache()
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend, загружающий пользователя сессии через user_cache."""
+
+    def get_user(self, user_id):
+        user = user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                user_cache.set(user)
+        return user
+
+
+@receiver(user_logged_in)
+def cache_logged_in_user(sender, user, **kwargs):
+    """Первый запрос после входа тоже обходится без запроса пользователя."""
+    user_cache.set(user)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def forget_user(sender, instance, **kwargs):
+    user_cache.delete(instance.pk)
@@ -0,0 +1,165 @@
+"""
+Общий слой кеширования поверх django.core.cache.
+
+CacheNamespace добавляет к ключам префикс пространства, хранит
+версии для сброса целых групп записей, считает попадания и промахи
+и умеет get_or_set с защитой от одновременного пересчёта. Где живут
+данные, решает CACHES: LocMem в dev, общий для воркеров файловый
+кеш в prod.
+"""
+import functools
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+MISSING = object()
+
+namespaces = {}
+
+
+class CacheNamespace:
+    """
+    Пространство ключей '<name>:<key>' в одном из кешей CACHES.
+
+    Записи get_or_set хранятся вместе со временем пересчёта, поэтому
+    читать их нужно только через get_or_set.
+    """
+
+    def __init__(self, name, alias=DEFAULT_CACHE_ALIAS, early=0.1,
+                 lock_timeout=10, lock_wait=0.05):
+        self.name = name
+        self.alias = alias
+        self.early = early
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        namespaces[name] = self
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def key(self, key):
+        return f'{self.name}:{key}'
+
+    def count(self, event):
+        with self._stats_lock:
+            self.stats[event] += 1
+
+    def get(self, key, default=None):
+        value = self.cache.get(self.key(key), MISSING)
+        if value is MISSING:
+            self.count('misses')
+            return default
+        self.count('hits')
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.cache.set(self.key(key), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT):
+        return self.cache.add(self.key(key), value, timeout)
+
+    def delete(self, key):
+        self.cache.delete(self.key(key))
+
+    def version(self, key):
+        """
+        Текущая версия набора закешированных данных.
+
+        Начальное значение берётся из часов, поэтому после вытеснения
+        ключа версии из кеша старые записи не станут снова актуальными.
+        """
+        key = self.key(key)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, time.time_ns(), None)
+            version = self.cache.get(key)
+        return version
+
+    def bump(self, key):
+        """Помечаем все записи, построенные на старой версии, устаревшими."""
+        key = self.key(key)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, time.time_ns(), None)
+
+    def get_or_set(self, key, compute, timeout=DEFAULT_TIMEOUT,
+                   cacheable=None):
+        """
+        Значение из кеша или результат compute(), посчитанный однажды.
+
+        Последнюю долю early срока жизни запись считается устаревающей:
+        процесс, первым взявший блокировку, пересчитывает её заранее,
+        остальные пока получают старое значение. При промахе процессы
+        без блокировки ждут, пока её держатель положит значение в кеш.
+        Значение, для которого cacheable(value) ложно, отдаётся, но
+        в кеш не попадает; ожидающие тогда считают его сами.
+        """
+        entry = self.cache.get(self.key(key))
+        if entry is not None:
+            refresh_at, value = entry
+            if time.time() < refresh_at or not self._lock(key):
+                self.count('hits')
+                return value
+            self.count('early_recomputes')
+            return self._compute(key, compute, timeout, cacheable)
+        self.count('misses')
+        deadline = time.monotonic() + self.lock_timeout
+        while not self._lock(key):
+            if time.monotonic() >= deadline:
+                # Держатель блокировки не успел или упал: считаем сами.
+                return compute()
+            time.sleep(self.lock_wait)
+            entry = self.cache.get(self.key(key))
+            if entry is not None:
+                return entry[1]
+        return self._compute(key, compute, timeout, cacheable)
+
+    def _lock(self, key):
+        return self.cache.add(self.key(f'{key}:lock'), 1, self.lock_timeout)
+
+    def _compute(self, key, compute, timeout, cacheable=None):
+        try:
+            value = compute()
+            if cacheable is not None and not cacheable(value):
+                return value
+            expires = self.cache.get_backend_timeout(timeout)
+            now = time.time()
+            refresh_at = (
+                float('inf') if expires is None
+                else expires - (expires - now) * self.early
+            )
+            self.cache.set(self.key(key), (refresh_at, value), timeout)
+            return value
+        finally:
+            self.cache.delete(self.key(f'{key}:lock'))
+
+
+def invalidation(func):
+    """
+    Сброс кеша, который повторяется после коммита транзакции.
+
+    Пока транзакция не закоммичена, другие процессы читают старые
+    данные и могут закешировать их уже под новой версией. Повторный
+    сброс из on_commit делает такие записи устаревшими; сброс сразу
+    нужен, чтобы изменения видел код той же транзакции.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        func(*args, **kwargs)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(functools.partial(func, *args, **kwargs))
+    return wrapper
+
+
+def cache_stats():
+    """Попадания и промахи по пространствам с запуска процесса."""
+    return {name: dict(namespace.stats)
+            for name, namespace in namespaces.items()}
@@ -0,0 +1,9 @@
+"""PostgreSQL с проверкой постоянного соединения и пулом в процессе."""
+from django.db.backends.postgresql import base
+
+from ...pool import HealthCheckMixin, PooledDatabaseMixin
+
+
+class DatabaseWrapper(PooledDatabaseMixin, HealthCheckMixin,
+                      base.DatabaseWrapper):
+    pass
@@ -0,0 +1,32 @@
+"""SQLite с WAL, настроенными PRAGMA, проверкой соединения и пулом."""
+from django.db.backends.sqlite3 import base
+
+from ...pool import HealthCheckMixin, PooledDatabaseMixin
+
+# Для одного узла: WAL не блокирует чтение записью, NORMAL в режиме WAL
+# не теряет целостность, кеш страниц и mmap сокращают чтения с диска.
+PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -20000,
+    'mmap_size': 128 * 1024 * 1024,
+    'busy_timeout': 5000,
+}
+
+
+class PragmaDatabaseWrapper(base.DatabaseWrapper):
+    """Новое соединение получает PRAGMA, дополненные OPTIONS['pragmas']."""
+
+    def get_new_connection(self, conn_params):
+        conn_params = dict(conn_params)
+        pragmas = {**PRAGMAS, **conn_params.pop('pragmas', {})}
+        connection = super().get_new_connection(conn_params)
+        for name, value in pragmas.items():
+            connection.execute(f'PRAGMA {name} = {value}')
+        return connection
+
+
+class DatabaseWrapper(PooledDatabaseMixin, HealthCheckMixin,
+                      PragmaDatabaseWrapper):
+    pass
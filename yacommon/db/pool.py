@@ -0,0 +1,146 @@
+"""Пул соединений в процессе и проверка постоянных соединений."""
+import functools
+import queue
+import threading
+
+
+class PoolTimeout(Exception):
+    """Все соединения пула заняты дольше допустимого."""
+
+
+class ConnectionPool:
+    """
+    Потокобезопасный пул «сырых» соединений DB-API.
+
+    Соединения создаются лениво, не больше size; последнее
+    возвращённое выдаётся первым, чтобы лишние реже использовались.
+    """
+
+    def __init__(self, connect, size, timeout):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self.connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise PoolTimeout(
+                f'Нет свободного соединения за {self.timeout} с.'
+            )
+
+    def release(self, connection, discard=False):
+        """Возвращаем соединение; сломанное закрываем и забываем."""
+        if not discard:
+            try:
+                connection.rollback()
+            except Exception:
+                discard = True
+        if discard:
+            with self._lock:
+                self._created -= 1
+            try:
+                connection.close()
+            except Exception:
+                pass
+            return
+        self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self.release(connection, discard=True)
+
+
+class PooledDatabaseMixin:
+    """
+    Примесь к DatabaseWrapper: соединения берутся из пула процесса.
+
+    Включается POOL_SIZE > 0 в настройках базы. Django закрывает
+    соединение в конце запроса, а примесь вместо закрытия отдаёт
+    его обратно в пул.
+    """
+
+    pools = {}
+    pools_lock = threading.Lock()
+
+    @property
+    def pool(self):
+        if not self.settings_dict.get('POOL_SIZE'):
+            return None
+        return self.pools.get(self.alias)
+
+    def get_new_connection(self, conn_params):
+        size = self.settings_dict.get('POOL_SIZE')
+        if not size:
+            return super().get_new_connection(conn_params)
+        with self.pools_lock:
+            if self.alias not in self.pools:
+                self.pools[self.alias] = ConnectionPool(
+                    functools.partial(
+                        super().get_new_connection, conn_params
+                    ),
+                    size,
+                    self.settings_dict.get('POOL_TIMEOUT', 10),
+                )
+        return self.pools[self.alias].acquire()
+
+    def _close(self):
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+        pool.release(
+            self.connection,
+            discard=self.errors_occurred or not self.is_usable()
+        )
+
+
+class HealthCheckMixin:
+    """
+    Проверка постоянного соединения, как CONN_HEALTH_CHECKS в Django 4.1.
+
+    Перед первым обращением к БД в очередном HTTP-запросе
+    переиспользуемое соединение проверяется is_usable() и при
+    необходимости открывается заново, а не падает на первом запросе.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.health_check_done = True
+
+    def close_if_unusable_or_obsolete(self):
+        super().close_if_unusable_or_obsolete()
+        self.health_check_done = False
+
+    def ensure_connection(self):
+        if (
+            not self.health_check_done
+            and self.connection is not None
+            and self.settings_dict.get('CONN_HEALTH_CHECKS')
+            and not self.in_atomic_block
+            and not self.is_usable()
+        ):
+            self.close()
+        self.health_check_done = True
+        super().ensure_connection()
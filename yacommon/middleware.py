@@ -0,0 +1,199 @@
+"""Учёт запросов к БД и времени обработки каждого HTTP-запроса."""
+import asyncio
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """Представление выполнило больше запросов, чем разрешено."""
+
+
+class QueryCounter:
+    """Обёртка выполнения SQL, считающая запросы и время в БД."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+
+
+# Счётчик текущего HTTP-запроса. Контекстная переменная, а не обёртка
+# на время запроса, потому что под ASGI запросы к БД выполняются
+# в другом потоке, чем middleware, и переменная переходит туда вместе
+# с контекстом sync_to_async.
+current_counter = ContextVar('current_counter', default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    counter = current_counter.get()
+    if counter is None:
+        return execute(sql, params, many, context)
+    return counter(execute, sql, params, many, context)
+
+
+def install_counter():
+    """Подключаем count_queries к соединениям текущего потока."""
+    for alias in connections:
+        wrappers = connections[alias].execute_wrappers
+        if count_queries not in wrappers:
+            wrappers.append(count_queries)
+
+
+class RequestStats:
+    """Статистика процесса, агрегированная по именам маршрутов."""
+
+    FIELDS = ('queries', 'db_ms', 'template_ms', 'total_ms')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def record(self, url_name, **values):
+        with self._lock:
+            entry = self._data.setdefault(url_name, {
+                'requests': 0,
+                **{f'{field}_sum': 0 for field in self.FIELDS},
+                **{f'{field}_max': 0 for field in self.FIELDS},
+            })
+            entry['requests'] += 1
+            for field in self.FIELDS:
+                entry[f'{field}_sum'] += values[field]
+                entry[f'{field}_max'] = max(
+                    entry[f'{field}_max'], values[field]
+                )
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                url_name: {
+                    'requests': entry['requests'],
+                    **{
+                        f'{field}_avg': round(
+                            entry[f'{field}_sum'] / entry['requests'], 3
+                        )
+                        for field in self.FIELDS
+                    },
+                    **{
+                        f'{field}_max': round(entry[f'{field}_max'], 3)
+                        for field in self.FIELDS
+                    },
+                }
+                for url_name, entry in self._data.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._data.clear()
+
+
+stats = RequestStats()
+
+
+class QueryBudgetMiddleware:
+    """
+    Замеряет число запросов, время в БД, рендеринга и всего запроса.
+
+    Результат отдаётся в заголовке Server-Timing и накапливается
+    в stats. Если для имени маршрута задан бюджет в QUERY_BUDGETS,
+    его превышение пишется в лог или, при
+    QUERY_BUDGET_ACTION = 'raise', приводит к QueryBudgetExceeded.
+    Middleware ставится первым в MIDDLEWARE. Тогда total охватывает
+    все остальные middleware, а его process_template_response
+    вызывается последним, и tpl меряет только рендеринг
+    TemplateResponse. Работа middleware снаружи, если они есть,
+    в Server-Timing и stats не попадает.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Под ASGI не переключаемся в поток на время всего запроса.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        counter, token = self.start(request)
+        try:
+            install_counter()
+            response = self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        return self.finish(request, counter, response)
+
+    async def __acall__(self, request):
+        counter, token = self.start(request)
+        try:
+            await sync_to_async(install_counter)()
+            response = await self.get_response(request)
+        finally:
+            current_counter.reset(token)
+        return self.finish(request, counter, response)
+
+    @staticmethod
+    def start(request):
+        request.template_duration = 0.0
+        request.start_time = time.perf_counter()
+        counter = QueryCounter()
+        return counter, current_counter.set(counter)
+
+    def finish(self, request, counter, response):
+        total = time.perf_counter() - request.start_time
+        url_name = (
+            request.resolver_match.view_name
+            if request.resolver_match else None
+        )
+        response['Server-Timing'] = (
+            f'db;dur={counter.duration * 1000:.2f};'
+            f'desc="{counter.count} queries", '
+            f'tpl;dur={request.template_duration * 1000:.2f}, '
+            f'total;dur={total * 1000:.2f}'
+        )
+        stats.record(
+            url_name,
+            queries=counter.count,
+            db_ms=counter.duration * 1000,
+            template_ms=request.template_duration * 1000,
+            total_ms=total * 1000,
+        )
+        self.check_budget(url_name, counter.count)
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+
+        def rendered(response):
+            request.template_duration = time.perf_counter() - start
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def check_budget(url_name, count):
+        budget = getattr(settings, 'QUERY_BUDGETS', {}).get(url_name)
+        if budget is None or count <= budget:
+            return
+        message = (
+            f'{url_name}: выполнено запросов {count}, бюджет {budget}'
+        )
+        if getattr(settings, 'QUERY_BUDGET_ACTION', 'log') == 'raise':
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,40 @@
+"""
+Прогрев кеша шаблонов.
+
+Кеширующий загрузчик разбирает каждый шаблон один раз на процесс
+и дальше отдаёт готовый объект Template. warm_templates загружает
+все шаблоны проекта при старте воркера, чтобы разбор не доставался
+первым запросам.
+"""
+from pathlib import Path
+
+from django.template import engines
+from django.template.loaders.cached import Loader as CachedLoader
+
+
+def template_names(engine):
+    """Имена всех HTML-шаблонов из каталогов, которые видят загрузчики."""
+    names = set()
+    for loader in engine.template_loaders:
+        for directory in map(Path, loader.get_dirs()):
+            names.update(
+                path.relative_to(directory).as_posix()
+                for path in directory.rglob('*.html')
+            )
+    return sorted(names)
+
+
+def warm_templates(using='django'):
+    """
+    Загружаем все шаблоны в кеширующий загрузчик движка.
+
+    Без кеширующего загрузчика прогревать нечего, возвращаем 0.
+    """
+    engine = engines[using].engine
+    if not any(isinstance(loader, CachedLoader)
+               for loader in engine.template_loaders):
+        return 0
+    names = template_names(engine)
+    for name in names:
+        engine.get_template(name)
+    return len(names)
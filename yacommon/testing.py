@@ -0,0 +1,30 @@
+"""
+Помощники тестовых данных, общие для обоих проектов.
+
+Объекты создаются пачками через bulk_create; фабрики конкретных
+моделей лежат в тестах каждого проекта.
+"""
+from django.contrib.auth import get_user_model
+
+BATCH_SIZE = 1000
+
+
+def bulk_create(model, objects):
+    """
+    Создаём объекты пачками и возвращаем их вместе с pk.
+
+    SQLite в Django 3.2 не возвращает pk из bulk_create, поэтому
+    созданные строки перечитываем по pk больше прежнего максимума.
+    """
+    last_pk = model.objects.order_by('-pk').values_list(
+        'pk', flat=True
+    ).first() or 0
+    model.objects.bulk_create(objects, batch_size=BATCH_SIZE)
+    return list(model.objects.filter(pk__gt=last_pk).order_by('pk'))
+
+
+def make_users(count, prefix='user'):
+    User = get_user_model()
+    return bulk_create(
+        User, (User(username=f'{prefix}{index}') for index in range(count))
+    )
@@ -0,0 +1,10 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from .middleware import stats
+
+
+@staff_member_required
+def request_stats(request):
+    """Статистика запросов процесса по именам маршрутов."""
+    return JsonResponse(stats.snapshot(), json_dumps_params={'indent': 2})